@@ -0,0 +1,56 @@
+# orion: Split the CLI entrypoint out of main.py and defer importing Orion until after argv handling, so help and
+# usage errors return without loading requests/pydantic and the rest of the agent stack.
+
+import argparse
+import pathlib
+
+# orion: Replace hand-rolled flag parsing with a module-level argparse parser built once per process; it also accepts
+# the -ePATH and --external-dir=PATH spellings.
+_PARSER = argparse.ArgumentParser(
+    prog="orion",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog="Environment:\n  OPENAI_API_KEY, AI_MODEL, ORION_DEP_TTL_SEC",
+)
+_PARSER.add_argument(
+    "-e",
+    "--external-dir",
+    metavar="PATH",
+    default=None,
+    help="External Project Description directory (flat). When omitted, external deps are disabled.",
+)
+_PARSER.add_argument(
+    "repo_root",
+    nargs="?",
+    default=None,
+    help="Repository root (defaults to the current directory).",
+)
+
+
+def main() -> None:
+    """
+    Orion CLI entrypoint.
+
+    Usage:
+        orion [--external-dir PATH|-e PATH] [repo_root]
+
+    Notes:
+        - OPENAI_API_KEY and AI_MODEL must be set in the environment.
+        - Optional: ORION_DEP_TTL_SEC influences dependency summary TTL behavior.
+        - If repo_root is not supplied, the current directory is used.
+
+    Options:
+        -e, --external-dir PATH   External Project Description directory (flat). When omitted, external dependency features are disabled.
+    """
+    ns = _PARSER.parse_args()
+    external_dir = ns.external_dir
+    repo_root_arg = ns.repo_root
+
+    # orion: Import the agent stack (requests, pydantic, tools) only once we know we will run it.
+    from .main import Orion
+
+    repo_root = pathlib.Path(repo_root_arg).resolve() if repo_root_arg else pathlib.Path(".").resolve()
+    Orion(repo_root, external_dir=external_dir).run()
+
+
+if __name__ == "__main__":
+    main()
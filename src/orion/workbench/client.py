@@ -1,14 +1,16 @@
 # orion: Replace clean_invalid_ref_nodes with _preprocess_for_openai; enforce required=all property keys and additionalProperties=false for objects; keep Responses-only client and improve strict schema compatibility.
 
+import atexit
 import json
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
-from .config import MAX_COMPLETION_TOKENS
+from .config import MAX_COMPLETION_TOKENS, ORION_HTTP_DUMP, ORION_HTTP_DUMP_PRETTY
 from .context import Context
+from .fs import dumps_compact
 
-from copy import deepcopy
 from pydantic import BaseModel
 # orion: Add pathlib and time for optional .httpcalls request/response logging to REST Client .http files.
 import pathlib
@@ -20,6 +22,127 @@ import os
 # orion: Add HTTPAdapter + Retry for HTTPS-level retries on idempotent and POST calls per hardening plan.
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+# orion: Socket options for pooled connections (Nagle off, TCP keepalive on).
+import socket
+from urllib3.connection import HTTPConnection
+# orion: Thread pool for dispatching independent tool calls of a single model turn concurrently.
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# orion: Tools that prompt the user, mutate shared on-disk state, or may regenerate a cached file through the model
+# (get_project_orion_summary rebuilds and writes the POS when stale). In a turn, the first of these and every call
+# after it run serially in emission order; only the calls before it may run concurrently.
+_SERIAL_TOOLS = frozenset({
+    "ask_user",
+    "get_project_orion_summary",
+    "add_todo",
+    "set_todo_status",
+    "remove_todo",
+    "download_info",
+    "rename_download",
+    "remove_download",
+})
+
+
+# orion: Factor tool-argument parsing out of the tool loop so serial and parallel dispatch share it.
+def _parse_tool_args(args_text: Any) -> Dict[str, Any]:
+    """Parse a tool call's arguments (JSON text or dict); malformed input yields empty args."""
+    try:
+        return json.loads(args_text) if isinstance(args_text, str) else (args_text or {})
+    except Exception:
+        # orion: Be forgiving with tool arg parsing; default to empty args if malformed.
+        return {}
+
+
+# orion: Minimal server-sent-events reader for streamed Responses calls: "data:" lines are joined per event and the
+# event is yielded as parsed JSON once its terminating blank line arrives. Comment/other fields are ignored.
+def _iter_sse_events(r: requests.Response) -> Iterator[Dict[str, Any]]:
+    """Yield each JSON event of a text/event-stream response in arrival order."""
+    data_lines: List[bytes] = []
+    for line in r.iter_lines(chunk_size=None):
+        if line:
+            if line.startswith(b"data:"):
+                data_lines.append(line[5:].lstrip())
+            continue
+        if data_lines:
+            data = b"\n".join(data_lines)
+            data_lines = []
+            if data != b"[DONE]":
+                yield json.loads(data)
+    if data_lines and data_lines != [b"[DONE]"]:
+        yield json.loads(b"\n".join(data_lines))
+
+
+# orion: urllib3 already disables Nagle by default; keep its defaults explicit and add SO_KEEPALIVE so idle pooled
+# connections between long tool turns are not silently dropped by middleboxes.
+_SOCKET_OPTIONS = list(dict.fromkeys([
+    *HTTPConnection.default_socket_options,
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]))
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter whose pool manager opens connections with _SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+# orion: Build the HTTPS adapter used by the shared session: sized connection pool plus Retry for 429 and 5xx.
+def _new_https_adapter() -> HTTPAdapter:
+    """Return an HTTPAdapter with a sized pool, keepalive sockets, and conservative urllib3 Retry (falls back to no Retry)."""
+    try:
+        retries = Retry(
+            total=3,
+            connect=3,
+            read=3,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    except Exception:
+        # Best-effort; do not fail initialization if urllib3 Retry is unavailable.
+        retries = 0
+    return _SocketOptionsAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+
+
+# orion: Base delays (seconds) for call_responses' own retry loop, indexed by attempt and scaled by 0.5–1.5x jitter.
+_RETRY_BACKOFFS = (1.0, 2.0, 4.0)
+
+
+# orion: One process-wide Session so every client reuses pooled keep-alive TLS connections instead of
+# paying a fresh handshake per instance. Auth headers are passed per request, never set on the session.
+_SESSION = requests.Session()
+_SESSION.mount("https://", _new_https_adapter())
+
+# orion: Response schemas are module-level constants passed to every call of a tool loop; keep each preprocessed result
+# keyed by the identity of its source. The source is held in the entry, so its id cannot be recycled while cached, and
+# the identity check guards against a different dict at the same address. Schemas are treated as immutable.
+_PREPROCESS_CACHE: "OrderedDict[int, Tuple[dict, dict]]" = OrderedDict()
+_PREPROCESS_CACHE_MAX = 64
+
+
+def _preprocess_for_openai_cached(schema: dict) -> dict:
+    """Return _preprocess_for_openai(schema), reusing the result for a schema object seen before."""
+    key = id(schema)
+    hit = _PREPROCESS_CACHE.get(key)
+    if hit is not None and hit[0] is schema:
+        _PREPROCESS_CACHE.move_to_end(key)
+        return hit[1]
+    cleaned = _preprocess_for_openai(schema)
+    _PREPROCESS_CACHE[key] = (schema, cleaned)
+    if len(_PREPROCESS_CACHE) > _PREPROCESS_CACHE_MAX:
+        _PREPROCESS_CACHE.popitem(last=False)
+    return cleaned
+
+
+# orion: Exact leaf types a JSON schema holds; such values are shared as-is without a recursive call.
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
 
 # orion: Introduce a centralized OpenAI schema preprocessor that (1) removes sibling keys alongside $ref and (2) enforces strict object-shape requirements by ensuring required includes all property keys and additionalProperties=False for any node with properties.
 
@@ -32,17 +155,23 @@ def _preprocess_for_openai(schema: dict) -> dict:
         * "additionalProperties" is set to False
     The transformation is applied recursively across the schema tree.
     """
-    cleaned = deepcopy(schema)
-
-    def _walk(node: Any) -> None:
+    # orion: Build the cleaned tree in one pass instead of deepcopy + an in-place walk. Subtrees that need no change
+    # are returned as-is (shared with the source), so only the path to each edited node is copied; scalar leaves are
+    # never visited. Key order matches the former in-place edit.
+    def _clean(node: Any) -> Any:
         if isinstance(node, dict):
             # If a $ref is present, drop all sibling keys for OpenAI compatibility
             if "$ref" in node:
-                for k in list(node.keys()):
-                    if k != "$ref":
-                        node.pop(k, None)
-                return  # Nothing else to do at this node
-
+                return node if len(node) == 1 else {"$ref": node["$ref"]}
+            out = None
+            for k, v in node.items():
+                if type(v) in _JSON_SCALARS:
+                    continue
+                cv = _clean(v)
+                if cv is not v:
+                    if out is None:
+                        out = dict(node)
+                    out[k] = cv
             # Enforce strict object shape where properties are specified
             props = node.get("properties")
             if isinstance(props, dict):
@@ -52,19 +181,28 @@ def _preprocess_for_openai(schema: dict) -> dict:
                     existing_set = set(existing_req)
                 except TypeError:
                     existing_set = set()
-                all_keys = set(props.keys()) | existing_set
-                node["required"] = sorted(all_keys)
-                node["additionalProperties"] = False
-
-            # Recurse into all values
-            for v in list(node.values()):
-                _walk(v)
-        elif isinstance(node, list):
-            for item in node:
-                _walk(item)
-
-    _walk(cleaned)
-    return cleaned
+                required = sorted(set(props.keys()) | existing_set)
+                if out is None and node.get("required") == required and node.get("additionalProperties") is False:
+                    return node
+                if out is None:
+                    out = dict(node)
+                out["required"] = required
+                out["additionalProperties"] = False
+            return node if out is None else out
+        if isinstance(node, list):
+            out_list = None
+            for i, item in enumerate(node):
+                if type(item) in _JSON_SCALARS:
+                    continue
+                ci = _clean(item)
+                if ci is not item:
+                    if out_list is None:
+                        out_list = list(node)
+                    out_list[i] = ci
+            return node if out_list is None else out_list
+        return node
+
+    return _clean(schema)
 
 
 
@@ -101,7 +239,8 @@ class ChatCompletionsClient:
           - OpenAI: Authorization: Bearer <OPENAI_API_KEY>
           - Azure:  api-key: <AZURE_OPENAI_API_KEY>
         """
-        self.session = requests.Session()
+        # orion: Reuse the module-level session; provider auth lives in self._headers and is sent per request.
+        self.session = _SESSION
 
         api_cfg = (settings or {}).get("api") if isinstance(settings, dict) else None
         api_cfg = api_cfg if isinstance(api_cfg, dict) else {}
@@ -144,10 +283,10 @@ class ChatCompletionsClient:
                 raise RuntimeError("Azure provider selected but no API key provided (AZURE_OPENAI_API_KEY or settings.api.api_key or api_key arg).")
             if not resolved_model:
                 raise RuntimeError("Azure provider selected but no model deployment provided (AZURE_OPENAI_MODEL or settings.api.model or model arg).")
-            self.session.headers.update({
+            self._headers = {
                 "api-key": resolved_api_key,
                 "Content-Type": "application/json",
-            })
+            }
         else:  # openai
             resolved_api_key = api_key or api_cfg.get("api_key") or os.environ.get("OPENAI_API_KEY")
             resolved_model = model or api_cfg.get("model") or os.environ.get("AI_MODEL") or "gpt-5"
@@ -158,53 +297,45 @@ class ChatCompletionsClient:
                 resolved_base_url = f"{resolved_base_url}/v1"
             if not resolved_api_key:
                 raise RuntimeError("OpenAI provider selected but no API key provided (OPENAI_API_KEY or settings.api.api_key or api_key arg).")
-            self.session.headers.update({
+            self._headers = {
                 "Authorization": f"Bearer {resolved_api_key}",
                 "Content-Type": "application/json",
-            })
+            }
 
         # Finalize
         self.model = resolved_model  # OpenAI model id or Azure deployment name
         self.base_url = resolved_base_url
         self.provider = provider
-
-        # orion: Mount HTTPS adapter with Retry for 429 and 5xx to absorb transient upstream failures.
-        self._mount_https_retry_adapter()
-
-    # orion: HTTPS adapter mounting with conservative Retry to complement the outer manual retry loop.
-    def _mount_https_retry_adapter(self) -> None:
-        try:
-            retries = Retry(
-                total=3,
-                connect=3,
-                read=3,
-                status=3,
-                backoff_factor=0.5,
-                status_forcelist=(429, 500, 502, 503, 504),
-                allowed_methods=frozenset(["GET", "POST"]),
-                respect_retry_after_header=True,
-                raise_on_status=False,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.session.mount("https://", adapter)
-        except Exception:
-            # Best-effort; do not fail initialization if urllib3 Retry is unavailable.
-            pass
-
-    # orion: Rebuild the requests Session to refresh TLS sockets while preserving headers and HTTPS retries.
+        # orion: Opt-in streaming (settings api.stream: true): consume the Responses SSE stream so tool calls are
+        # dispatched as soon as each one is complete, and long reasoning turns are bounded by per-read rather than
+        # whole-response timeouts.
+        self.stream = bool(api_cfg.get("stream", False))
+        # orion: ORION_HTTP_DUMP overrides the per-call .httpcalls settings; None defers to them.
+        self._http_dump: Optional[bool] = (
+            None if not ORION_HTTP_DUMP else ORION_HTTP_DUMP not in ("0", "false", "no", "off")
+        )
+
+        # orion: Shared worker pool for running independent tool calls of one turn concurrently.
+        self._tool_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="orion-tool")
+        # orion: .httpcalls writes run on one background thread so disk I/O never delays a turn; a single worker keeps
+        # each file's request, response and exception sections in submission order.
+        self._log_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orion-httplog")
+        # orion: Flush queued .httpcalls records on any interpreter exit (including sys.exit and unhandled errors).
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Flush pending .httpcalls writes and release the client's worker threads; safe to call more than once."""
+        # Tool calls still running belong to an abandoned turn; queued ones are cancelled rather than started.
+        self._tool_pool.shutdown(wait=False, cancel_futures=True)
+        self._log_pool.shutdown(wait=True)
+
+    # orion: Route new requests to a fresh HTTPS connection pool after a connection error; headers are per request.
+    # The session is shared with concurrent callers (parallel summarization), so the old adapter is not closed: requests
+    # in flight on other threads keep their connections, and its pool is released once nothing references it. The
+    # swap is a single assignment to an existing adapters key, which get_adapter() can read safely meanwhile
+    # (Session.mount would also re-order the dict). Dead sockets in either pool are discarded by urllib3 on reuse.
     def _rebuild_session(self) -> None:
-        try:
-            headers = dict(self.session.headers)
-        except Exception:
-            headers = {}
-        try:
-            self.session.close()
-        except Exception:
-            pass
-        self.session = requests.Session()
-        if headers:
-            self.session.headers.update(headers)
-        self._mount_https_retry_adapter()
+        self.session.adapters["https://"] = _new_https_adapter()
 
     # orion: Expand docstring and comments; Responses API is the single entry point and supports iterative tool-call handling.
     def call_responses(
@@ -216,9 +347,12 @@ class ChatCompletionsClient:
         max_completion_tokens: Optional[int] = None,
         interactive_tool_runner=None,
         message_sink=None,
+        message_batch_sink=None,
         call_type: str = "minimal",
         model: Optional[str] = None,
         _timeout: int = 1800,
+        parallel_tools: bool = True,
+        use_previous_response_id: bool = True,
     ) -> Dict[str, Any]:
         """
         Invoke the Responses API and normalize the result into a strict JSON object. 
@@ -235,8 +369,17 @@ class ChatCompletionsClient:
             max_completion_tokens: Optional cap for the model's final output.
             interactive_tool_runner: Callable(name, args) used to execute tools.
             message_sink: Optional callback invoked with assistant/tool messages.
+            message_batch_sink: Optional callback invoked once per tool turn with that turn's
+                messages (in order); when set, it replaces message_sink for tool turns.
             call_type: OpenAI call type hint for the endpoint.
             model: Optional model override for this call.
+            parallel_tools: Run the tool calls of a turn that precede its first serial
+                tool (user prompts, state writes, POS regeneration) concurrently; that
+                tool and every later call run in order. Results are still appended in
+                the order the model emitted them.
+            use_previous_response_id: After the first turn, chain follow-up turns with
+                previous_response_id and send only the new tool outputs instead of the
+                full message history.
 
         Returns:
             The strict JSON object produced by the model.
@@ -247,11 +390,16 @@ class ChatCompletionsClient:
         """
         reasoning_effort = "minimal" if call_type.endswith("_summary") else "medium"
         # orion: Preprocess schema for OpenAI strict mode: clean $ref siblings and enforce required for all properties with additionalProperties=False.
-        response_schema = _preprocess_for_openai(response_schema)
+        response_schema = _preprocess_for_openai_cached(response_schema)
 
         # Build a stable, normalized sink so we don't branch on None repeatedly.
+        # orion: While a tool turn is being recorded, messages are buffered and handed to message_batch_sink at once.
+        sink_buffer: Optional[List[Dict[str, Any]]] = None
+
         def _sink(msg: Dict[str, Any]) -> None:
-            if message_sink:
+            if sink_buffer is not None:
+                sink_buffer.append(msg)
+            elif message_sink:
                 message_sink(msg)
 
         model = model or self.model
@@ -259,17 +407,27 @@ class ChatCompletionsClient:
         url = f"{self.base_url}/responses"  # /v1/responses or /openai/v1/responses
         max_output_tokens = max_completion_tokens or MAX_COMPLETION_TOKENS
 
-        # orion: Work on a local copy of messages to append tool outputs and assistant echoes.
+        # orion: Work on a local copy of messages to append tool outputs and assistant echoes. The shallow copy is taken
+        # once per call (not per turn) and is required because system_state is replaced in place; chained turns send
+        # only new_items, so local_messages is serialized again only when the full history must be resent.
         local_messages = list(messages)
         max_tool_turns = 50
         turns = 0
 
+        # orion: Server-side context carryover. Once a response id is known, later turns send only the items added
+        # since the previous POST (function_call_output records). A system_state upgrade marks the state dirty so the
+        # next POST resends the full history with the state replaced in place, keeping a single system_state in context.
+        prev_response_id: Optional[str] = None
+        new_items: List[Dict[str, Any]] = []
+        state_dirty = False
+
         # orion: Helpers to locate/emit the latest system_state inside the in-flight message list.
         def _parse_system_state_from_msg(msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             if not isinstance(msg, dict) or msg.get("role") != "system":
                 return None
             content = msg.get("content")
-            if not isinstance(content, str):
+            # orion: A system_state always carries its type tag as text; other system messages skip the full parse.
+            if not isinstance(content, str) or "system_state" not in content:
                 return None
             try:
                 obj = json.loads(content)
@@ -279,42 +437,43 @@ class ChatCompletionsClient:
                 return obj
             return None
 
+        # orion: Locate and parse the latest system_state once per call; afterwards the parsed object and its index
+        # are tracked here, so tool turns never re-parse system messages. The object is live: promotions mutate it
+        # and _append_system_state re-serializes it into the same slot.
+        state_idx: Optional[int] = None
+        state_cache: Optional[Dict[str, Any]] = None
+        for i in range(len(local_messages) - 1, -1, -1):
+            state_cache = _parse_system_state_from_msg(local_messages[i])
+            if state_cache is not None:
+                state_idx = i
+                break
+
         def _find_latest_system_state() -> Optional[Dict[str, Any]]:
-            for m in reversed(local_messages):
-                obj = _parse_system_state_from_msg(m)
-                if obj is not None:
-                    return obj
-            return None
+            return state_cache
 
         # orion: Upsert system_state within the current call to keep exactly one system_state message in local_messages.
         # If a system_state exists, replace it in-place; otherwise append. We still sink to persist the upgrade across turns.
         def _append_system_state(obj: Dict[str, Any]) -> None:
+            nonlocal state_dirty, state_idx, state_cache
             # orion: Build the canonical message and replace the existing system_state rather than appending duplicates.
-            msg = {"type": "message", "role": "system", "content": json.dumps(obj, ensure_ascii=False)}
-            # Find the most recent system_state message index (if any)
-            idx: Optional[int] = None
-            for i in range(len(local_messages) - 1, -1, -1):
-                m = local_messages[i]
-                if m.get("role") != "system":
-                    continue
-                content = m.get("content")
-                if not isinstance(content, str):
-                    continue
-                try:
-                    parsed = json.loads(content)
-                except Exception:
-                    continue
-                if isinstance(parsed, dict) and parsed.get("type") == "system_state":
-                    idx = i
-                    break
-            if idx is not None:
+            msg = {"type": "message", "role": "system", "content": dumps_compact(obj)}
+            if state_idx is not None:
                 # orion: Replace in-place to dedupe system_state for this in-flight call.
-                local_messages[idx] = msg
+                local_messages[state_idx] = msg
             else:
                 # orion: No prior system_state in this call; append the first one.
+                state_idx = len(local_messages)
                 local_messages.append(msg)
+            state_cache = obj
             # orion: Persist the upgraded system_state so subsequent turns start from the latest state.
             _sink(msg)
+            state_dirty = True
+
+        # orion: Canonicalize the tool list once per call (caller's list is never mutated); web_search is added for
+        # non-minimal reasoning calls.
+        effective_tools: List[Dict[str, Any]] = list(tools) if tools else []
+        if reasoning_effort != "minimal":
+            effective_tools.append({"type": "web_search"})
 
         def _make_payload() -> Dict[str, Any]:
             # orion: Keep the same json_schema format you already use; Responses nests it under text.format.
@@ -332,10 +491,8 @@ class ChatCompletionsClient:
                 "max_output_tokens": max_output_tokens,
                 "reasoning": {"effort": reasoning_effort or "minimal"},
             }
-            payload["tools"] = tools.copy() if tools else []
+            payload["tools"] = effective_tools
             payload["tool_choice"] = "auto"
-            if reasoning_effort != "minimal":
-                payload["tools"].append({"type": "web_search"})
             return payload
 
         def _extract_msg_obj(resp_obj: Dict[str, Any]) -> Dict[str, Any]:
@@ -350,25 +507,37 @@ class ChatCompletionsClient:
             tool_calls = []
 
             # orion: Responses API streams a heterogeneous list; we stitch content while collecting tool_call objects.
+            # Single pass with bound appends: only "message" and "function_call" items are inspected further.
             if output and isinstance(output, list):
+                add_chunk = content_chunks.append
+                add_call = tool_calls.append
                 for o in output:
                     if not isinstance(o, dict):
                         continue
                     _otype = o.get("type")
-                    if _otype == "message":
+                    if _otype == "function_call":
+                        add_call(o)
+                    elif _otype == "message":
                         _ct = o.get("content")
                         if isinstance(_ct, str):
-                            content_chunks.append(_ct)
+                            add_chunk(_ct)
                         elif isinstance(_ct, list):
                             for item in _ct:
-                                if isinstance(item, str):
-                                    content_chunks.append(item)
-                                elif isinstance(item, dict) and item.get("type", "") == "output_text":
-                                    content_chunks.append(item.get("text", ""))
-                    elif _otype == "function_call":
-                        tool_calls.append(o)
-
-            content = "\n".join([c for c in content_chunks if isinstance(c, str)]) if content_chunks else None
+                                if isinstance(item, dict):
+                                    if item.get("type") == "output_text":
+                                        text = item.get("text")
+                                        if isinstance(text, str):
+                                            add_chunk(text)
+                                elif isinstance(item, str):
+                                    add_chunk(item)
+
+            # orion: Every collected chunk is already a str; the common single-chunk final answer is returned as-is.
+            if not content_chunks:
+                content = None
+            elif len(content_chunks) == 1:
+                content = content_chunks[0]
+            else:
+                content = "\n".join(content_chunks)
             return {"content": content, "tool_calls": tool_calls}
 
         # orion: Log token usage for every Responses API call; supports multiple schema variants for robustness.
@@ -415,16 +584,20 @@ class ChatCompletionsClient:
                 # Best-effort logging; never fail the request loop
                 pass
 
+        # orion: Hand a .httpcalls write to the logging thread; arguments must be immutable snapshots (bytes, str, or
+        # objects this call no longer changes), since the loop moves on before the write runs.
+        def _log_http(fn: Any, *args: Any) -> None:
+            try:
+                self._log_pool.submit(fn, *args)
+            except Exception:
+                pass  # Non-fatal
+
         # orion: Append exception details to the .httpcalls log when a request fails before an HTTP response exists.
         def _append_http_exception_log(http_file: Optional[pathlib.Path], elapsed_ms: int, exc: Exception) -> None:
             if http_file is None:
                 return
-            try:
-                with open(http_file, "a", encoding="utf-8") as f:
-                    f.write("\n\n### Exception — elapsed_ms: " + str(elapsed_ms) + "\n")
-                    f.write(type(exc).__name__ + ": " + str(exc) + "\n")
-            except Exception:
-                pass
+            text = "\n\n### Exception — elapsed_ms: " + str(elapsed_ms) + "\n" + type(exc).__name__ + ": " + str(exc) + "\n"
+            _log_http(_append_http_bytes, http_file, text.encode("utf-8"))
 
         # orion: Convert int/float timeout to (connect, read) tuple; pass tuples through unchanged.
         def _normalize_timeout(val: Any) -> Any:
@@ -433,55 +606,168 @@ class ChatCompletionsClient:
                 return (10, val)
             return val
 
+        # orion: Build the payload once per call; model, schema, token cap, reasoning, and tools are invariant across
+        # tool turns, so each turn only rebinds "input" to the (growing) local message list.
+        payload = _make_payload()
+        if self.stream:
+            payload["stream"] = True
+
+        # orion: Arguments are parsed exactly once; the log line reuses the model's raw JSON text instead of
+        # re-serializing the parsed dict, and the function_call record keeps that same string.
+        def _invoke(name: Any, args_text: Any) -> Any:
+            args = _parse_tool_args(args_text)
+            shown = args_text if isinstance(args_text, str) else json.dumps(args)
+            ctx.log(f"Invoking tool: {name} with args: {shown}")
+            return interactive_tool_runner(name, args)
+
+        # orion: With streaming, parallel-safe tool calls are started from the stream as each function_call item
+        # finishes (keyed by call_id) and picked up by the dispatch below instead of being submitted again.
+        early: Dict[Any, Future] = {}
+        early_names: Dict[Any, Any] = {}
+        dispatch_early = self.stream and parallel_tools and interactive_tool_runner is not None
+
+        # orion: Early calls whose response is abandoned (stream error, retried request) are never recorded. Cancel
+        # the ones still queued, wait out the ones already running, and log the latter since their effects stand.
+        def _drop_early(reason: str, keep: Any = ()) -> None:
+            for call_id, fut in list(early.items()):
+                if call_id in keep:
+                    continue
+                del early[call_id]
+                name = early_names.pop(call_id, None)
+                if fut.cancel():
+                    continue
+                try:
+                    fut.result()
+                except Exception:
+                    pass
+                try:
+                    ctx.log(f"Discarded early tool call {name} ({call_id}): {reason}")
+                except Exception:
+                    pass
+
+        # orion: The terminal event carries the same response object a non-streamed call returns, so the rest of
+        # the turn is unchanged; in-flight events only serve to start tool calls early. Transport errors raised while
+        # reading propagate to the retry loop, which resends the request once this attempt's early calls are dropped.
+        def _read_stream(r: Any) -> Dict[str, Any]:
+            resp = None
+            serial_seen = False
+            try:
+                for ev in _iter_sse_events(r):
+                    etype = ev.get("type")
+                    if etype == "response.output_item.done":
+                        item = ev.get("item")
+                        if not (isinstance(item, dict) and item.get("type") == "function_call"):
+                            continue
+                        # orion: Early dispatch stops at the first serial tool; it and every later call run in
+                        # emission order at dispatch time (see _SERIAL_TOOLS).
+                        if item.get("name") in _SERIAL_TOOLS:
+                            serial_seen = True
+                        elif dispatch_early and not serial_seen and item.get("call_id") not in early:
+                            early_names[item.get("call_id")] = item.get("name")
+                            early[item.get("call_id")] = self._tool_pool.submit(
+                                _invoke, item.get("name"), item.get("arguments", "{}")
+                            )
+                    elif etype in ("response.completed", "response.incomplete"):
+                        resp = ev.get("response")
+                    elif etype in ("response.failed", "error"):
+                        raise RuntimeError(f"Responses API stream error: {dumps_compact(ev)[:2000]}")
+                if not isinstance(resp, dict):
+                    raise RuntimeError("Responses API stream ended without a final response.")
+            except ValueError as e:
+                _drop_early("malformed event stream")
+                raise RuntimeError(f"Responses API returned a malformed event stream: {e}") from e
+            except BaseException as e:
+                _drop_early(f"stream interrupted ({type(e).__name__})")
+                raise
+            finally:
+                r.close()
+            return resp
+
+        # orion: The request body is assembled from pre-encoded pieces so a tool turn only encodes what is new. The
+        # invariant fields (model, schema, tools, limits) are encoded once; each input item is encoded the first time
+        # it is sent and its bytes reused afterwards. Items are never mutated once in local_messages (system_state
+        # upgrades swap in a new dict), so identity is a sound cache key; the item itself is held to pin its id.
+        invariant_json = dumps_compact(
+            {k: v for k, v in payload.items() if k not in ("input", "previous_response_id")}
+        ).encode("utf-8")[1:-1]
+        item_json: Dict[int, Tuple[Dict[str, Any], bytes]] = {}
+
+        def _encode_body() -> bytes:
+            parts: List[bytes] = []
+            for item in payload["input"]:
+                hit = item_json.get(id(item))
+                if hit is None or hit[0] is not item:
+                    hit = (item, dumps_compact(item).encode("utf-8"))
+                    item_json[id(item)] = hit
+                parts.append(hit[1])
+            prev = payload.get("previous_response_id")
+            head = b"{" + invariant_json
+            if prev is not None:
+                head += b',"previous_response_id":' + dumps_compact(prev).encode("utf-8")
+            return head + b',"input":[' + b",".join(parts) + b"]}"
+
+        # orion: Resolve the .httpcalls target once per call rather than per POST; settings and the directory do not
+        # change within a tool loop, so the stat/mkdir and header redaction happen once.
+        httpcalls_dir: Optional[pathlib.Path] = None
+        headers_for_log: Dict[str, str] = {}
+        try:
+            settings = getattr(ctx, "settings", {}) or {}
+            log_cfg = {}
+            if isinstance(settings, dict):
+                log_cfg = ((settings.get("logging") or {}).get("httpcalls") or {})
+            enabled = log_cfg.get("enabled") if isinstance(log_cfg, dict) else None
+            custom_dir = log_cfg.get("dir") if isinstance(log_cfg, dict) else None
+            if self._http_dump is not None:
+                enabled = self._http_dump
+
+            # Determine directory and behavior based on settings (enabled: false is an explicit off)
+            if enabled is True:
+                if custom_dir:
+                    cpath = pathlib.Path(str(custom_dir))
+                    httpcalls_dir = cpath if cpath.is_absolute() else (pathlib.Path(ctx.repo_root) / cpath)
+                else:
+                    httpcalls_dir = pathlib.Path(ctx.repo_root) / ".httpcalls"
+                # Ensure directory exists when explicitly enabled
+                httpcalls_dir.mkdir(parents=True, exist_ok=True)
+            elif enabled is not False:
+                # Back-compat: only log if default dir already exists
+                maybe = pathlib.Path(ctx.repo_root) / ".httpcalls"
+                if maybe.is_dir():
+                    httpcalls_dir = maybe
+
+            if httpcalls_dir is not None:
+                headers_for_log = dict(self._headers)
+                if "Authorization" in headers_for_log:
+                    headers_for_log["Authorization"] = "Bearer {{OPENAI_API_KEY}}"
+                if "api-key" in headers_for_log:
+                    headers_for_log["api-key"] = "{{AZURE_OPENAI_API_KEY}}"
+        except Exception:
+            httpcalls_dir = None  # Non-fatal: proceed without logging
+
         while True:
-            # orion: Build payload once per POST so logging captures the exact body sent.
-            payload = _make_payload()
+            chained = prev_response_id is not None and not state_dirty
+            if chained:
+                payload["previous_response_id"] = prev_response_id
+                payload["input"] = new_items
+            else:
+                payload.pop("previous_response_id", None)
+                payload["input"] = local_messages
+
+            # orion: Serialize the body once per turn (not per retry attempt) as compact UTF-8 JSON; non-ASCII text is
+            # sent raw instead of as \uXXXX escapes and separators carry no padding, shrinking large tool-loop bodies.
+            # All compact encoding goes through fs.dumps_compact, one preconstructed encoder shared with system_state.
+            body = _encode_body()
 
             # orion: If logging is enabled, write the request in REST Client format with redacted Authorization/api-key.
-            try:
-                http_file = None
-                settings = getattr(ctx, "settings", {}) or {}
-                log_cfg = {}
-                if isinstance(settings, dict):
-                    log_cfg = ((settings.get("logging") or {}).get("httpcalls") or {})
-                enabled = log_cfg.get("enabled") if isinstance(log_cfg, dict) else None
-                custom_dir = log_cfg.get("dir") if isinstance(log_cfg, dict) else None
-
-                # Determine directory and behavior based on settings
-                if enabled is False:
-                    http_file = None  # explicit off
-                else:
-                    # Compute target directory
-                    base_dir: Optional[pathlib.Path] = None
-                    if enabled is True:
-                        if custom_dir:
-                            cpath = pathlib.Path(str(custom_dir))
-                            base_dir = cpath if cpath.is_absolute() else (pathlib.Path(ctx.repo_root) / cpath)
-                        else:
-                            base_dir = pathlib.Path(ctx.repo_root) / ".httpcalls"
-                        # Ensure directory exists when explicitly enabled
-                        base_dir.mkdir(parents=True, exist_ok=True)
-                    else:
-                        # Back-compat: only log if default dir already exists
-                        maybe = pathlib.Path(ctx.repo_root) / ".httpcalls"
-                        if maybe.exists() and maybe.is_dir():
-                            base_dir = maybe
-
-                    if base_dir is not None:
-                        ts_ms = int(time.time() * 1000)
-                        http_file_path = base_dir / f"call-{ts_ms}.http"
-                        headers_for_log = dict(self.session.headers)
-                        if "Authorization" in headers_for_log:
-                            headers_for_log["Authorization"] = "Bearer {{OPENAI_API_KEY}}"
-                        if "api-key" in headers_for_log:
-                            headers_for_log["api-key"] = "{{AZURE_OPENAI_API_KEY}}"
-                        dumpHttpFile(str(http_file_path), url, "POST", headers_for_log, payload)
-                        http_file = http_file_path
-            except Exception:
-                http_file = None  # Non-fatal: proceed without logging
+            # The dump reuses the exact body bytes being sent; ORION_HTTP_DUMP_PRETTY re-encodes it indented instead.
+            http_file = None
+            if httpcalls_dir is not None:
+                http_file = httpcalls_dir / f"call-{int(time.time() * 1000)}.http"
+                _log_http(_write_http_request, http_file, url, headers_for_log, body)
 
             # orion: Conservative timeout to accommodate tool loops; Responses may stream chunks server-side.
-            # orion: Wrap the POST in a bounded retry loop for transient failures (timeouts, HTTP 5xx, TLS/connection errors). 4xx errors are not retried.
+            # orion: Bounded retry loop for timeouts and TLS/connection errors (the adapter's Retry covers these only until
+            # response headers arrive, not while the body is read) and for the unchained resend. HTTP statuses are left to Retry.
             max_retries = 3
             attempt = 0
             last_exc: Optional[Exception] = None
@@ -491,50 +777,53 @@ class ChatCompletionsClient:
                 t0 = time.time()
                 try:
                     # orion: From attempt ≥2, hint the server/proxies to close the socket to avoid reusing a bad connection.
-                    req_headers = {"Connection": "close"} if attempt >= 2 else None
+                    req_headers = {**self._headers, "Connection": "close"} if attempt >= 2 else self._headers
                     r = self.session.post(
                         url,
-                        json=payload,
+                        data=body,
                         timeout=_normalize_timeout(_timeout),
                         headers=req_headers,
+                        stream=self.stream,
                     )
                     elapsed_ms = int((time.time() - t0) * 1000)
 
                     # orion: Append a response section to the same .http file with status, headers, body, and elapsed time (non-fatal on errors).
-                    try:
-                        if http_file is not None:
-                            with open(http_file, "a", encoding="utf-8") as f:
-                                f.write("\n\n### Response — elapsed_ms: " + str(elapsed_ms) + "\n")
-                                # Best-effort HTTP status line; requests doesn't expose HTTP version reliably.
-                                f.write(f"HTTP/1.1 {r.status_code} {getattr(r, 'reason', '')}\n")
-                                for hk, hv in r.headers.items():
-                                    try:
-                                        f.write(f"{hk}: {hv}\n")
-                                    except Exception:
-                                        continue
-                                f.write("\n")
-                                try:
-                                    f.write(r.text)
-                                except Exception:
-                                    # Fallback if body can't be decoded as text
-                                    f.write("<binary/undecodable body>\n")
-                    except Exception:
-                        pass  # Non-fatal
+                    # A successful stream is consumed by the parser below; its final response is appended once complete.
+                    if http_file is not None:
+                        try:
+                            _log_http(
+                                _append_http_response,
+                                http_file,
+                                elapsed_ms,
+                                r.status_code,
+                                getattr(r, "reason", ""),
+                                list(r.headers.items()),
+                                b"<event stream>\n" if self.stream and r.status_code == 200 else r.content,
+                            )
+                        except Exception:
+                            pass  # Non-fatal
 
                     # Handle status codes
                     if r.status_code == 200:
+                        if self.stream:
+                            resp = _read_stream(r)
                         break  # success
-                    if r.status_code >= 500 and attempt <= max_retries:
-                        # orion: Retry on server errors with exponential backoff and jitter to smooth contention.
-                        base_delay = [1.0, 2.0, 4.0][min(attempt - 1, 2)]
-                        delay = base_delay * random.uniform(0.5, 1.5)
+                    # orion: 429 and 5xx statuses are retried inside session.post by the adapter's urllib3 Retry (backoff,
+                    # Retry-After honored); a status that reaches this point has exhausted those retries.
+                    if chained and r.status_code in (400, 404):
+                        # orion: Chained turn rejected (e.g. response storage disabled); resend full history and stop chaining.
                         try:
-                            ctx.log(f"Responses API attempt {attempt} received {r.status_code}; retrying in {delay:.2f}s...")
+                            ctx.log(f"Responses API rejected previous_response_id ({r.status_code}); resending full history.")
                         except Exception:
                             pass
-                        time.sleep(delay)
+                        use_previous_response_id = False
+                        prev_response_id = None
+                        chained = False
+                        payload.pop("previous_response_id", None)
+                        payload["input"] = local_messages
+                        body = _encode_body()
                         continue
-                    # Do not retry for 4xx; raise immediately with truncated body for diagnostics.
+                    # Raise with truncated body for diagnostics; other 4xx are not retried.
                     if r.status_code != 200:
                         raise RuntimeError(f"Responses API error {r.status_code}: {r.text[:2000]}")
                 except requests.exceptions.Timeout as e:
@@ -542,7 +831,7 @@ class ChatCompletionsClient:
                     elapsed_ms = int((time.time() - t0) * 1000)
                     _append_http_exception_log(http_file, elapsed_ms, e)
                     if attempt <= max_retries:
-                        base_delay = [1.0, 2.0, 4.0][min(attempt - 1, 2)]
+                        base_delay = _RETRY_BACKOFFS[min(attempt - 1, len(_RETRY_BACKOFFS) - 1)]
                         delay = base_delay * random.uniform(0.5, 1.5)
                         try:
                             ctx.log(f"Responses API timeout on attempt {attempt}; retrying in {delay:.2f}s...")
@@ -566,26 +855,47 @@ class ChatCompletionsClient:
                             self._rebuild_session()
                         except Exception:
                             pass
-                        base_delay = [1.0, 2.0, 4.0][min(attempt - 1, 2)]
+                        base_delay = _RETRY_BACKOFFS[min(attempt - 1, len(_RETRY_BACKOFFS) - 1)]
                         delay = base_delay * random.uniform(0.5, 1.5)
                         time.sleep(delay)
                         continue
                     raise RuntimeError(f"Responses API connection error after {attempt} attempt(s): {e}")
+                except requests.exceptions.RequestException as e:
+                    # orion: Anything else requests raises (e.g. while decoding a streamed body) is not transient.
+                    _append_http_exception_log(http_file, int((time.time() - t0) * 1000), e)
+                    raise RuntimeError(f"Responses API request failed: {e}") from e
                 # Exit inner retry loop on success
                 break
 
             if r is None:
                 raise RuntimeError("Responses API: no response object after retries.")
 
-            resp = r.json()
+            if self.stream:
+                if http_file is not None:
+                    _log_http(_append_http_json, http_file, resp)
+            else:
+                # orion: Parse the raw body bytes directly; r.json() would first sniff the encoding and build an intermediate str.
+                try:
+                    resp = json.loads(r.content)
+                except ValueError as e:
+                    raise RuntimeError(f"Responses API returned a non-JSON body: {e}") from e
 
             # orion: Log token usage for this call using robust parsing of usage fields.
             _log_usage(resp)
 
+            # orion: The items just sent are now part of the server-side context for the returned response id.
+            new_items.clear()
+            state_dirty = False
+            if use_previous_response_id and isinstance(resp.get("id"), str):
+                prev_response_id = resp["id"]
+
             # orion: Normalize the Responses payload into a chat-like message object for unified downstream handling.
             msg_obj = _extract_msg_obj(resp)
 
             tool_calls = msg_obj.get("tool_calls") or []
+            # orion: Early calls the final response does not carry (or a response with no tool calls) are never consumed.
+            if early:
+                _drop_early("not in the completed response", keep={tc.get("call_id") for tc in tool_calls})
             if tool_calls:
                 # orion: Record assistant turn with tool_calls for correct replay context in subsequent turns.
 
@@ -594,22 +904,34 @@ class ChatCompletionsClient:
 
                 turns += 1
                 if turns > max_tool_turns:
+                    _drop_early("tool-call turn limit reached")
                     raise RuntimeError("Exceeded max tool-call turns; aborting.")
 
-                # orion: Execute each tool call and append tool results to the conversation for the next model turn.
-                for tc in tool_calls:
-                    tc_id = tc.get("call_id")
-                    name = tc.get("name")
-                    args_text = tc.get("arguments", "{}")
-                    try:
-                        args = json.loads(args_text) if isinstance(args_text, str) else (args_text or {})
-                    except Exception:
-                        # orion: Be forgiving with tool arg parsing; default to empty args if malformed.
-                        args = {}
-                    # Run the tool
-                    ctx.log(f"Invoking tool: {name} with args: {json.dumps(args)}")
-                    tool_output = interactive_tool_runner(name, args)
+                # orion: Execute tool calls (concurrently when safe) and append results in original emission order.
+                calls = [(tc.get("call_id"), tc.get("name"), tc.get("arguments", "{}")) for tc in tool_calls]
 
+                # orion: Only the calls emitted before the first serial tool (user prompts, state writes, POS
+                # regeneration) overlap on the pool; they all finish before that tool runs, and it and everything after
+                # it run in emission order on this thread, so a reader emitted after a writer always sees the write.
+                first_serial = next(
+                    (i for i, (_, name, _) in enumerate(calls) if name in _SERIAL_TOOLS), len(calls)
+                )
+                outputs: List[Any] = []
+                if parallel_tools and (first_serial > 1 or early):
+                    futures = [
+                        early.pop(tc_id, None) or self._tool_pool.submit(_invoke, name, args_text)
+                        for tc_id, name, args_text in calls[:first_serial]
+                    ]
+                    early_names.clear()
+                    outputs = [fut.result() for fut in futures]
+                if early:
+                    _drop_early("emitted after a serial tool")
+                outputs.extend(_invoke(name, args_text) for _, name, args_text in calls[len(outputs):])
+
+                # orion: Buffer this turn's records so the batch sink persists them in one append.
+                if message_batch_sink is not None:
+                    sink_buffer = []
+                for (tc_id, name, args_text), tool_output in zip(calls, outputs, strict=True):
                     # orion: Always emit the function_call record.
                     _itc = { "type": "function_call", "name": name, "arguments": args_text, "call_id": tc_id }
                     _sink(_itc)
@@ -635,8 +957,10 @@ class ChatCompletionsClient:
                                 output_to_emit = {"status": "noop", "reason": "already_full", "path": path}
                             else:
                                 # Promote to full in system_state
+                                # orion: str.isascii() reads CPython's cached ASCII flag, so for the usual ASCII source
+                                # file the UTF-8 size is len() with no encode; only non-ASCII text is encoded to measure.
                                 try:
-                                    bcount = len(content.encode("utf-8"))
+                                    bcount = len(content) if content.isascii() else len(content.encode("utf-8"))
                                 except Exception:
                                     bcount = 0
                                 files_map[path] = {
@@ -655,9 +979,20 @@ class ChatCompletionsClient:
                             # No system_state or malformed tool result: avoid streaming file content
                             output_to_emit = {"status": "noop", "reason": "no_system_state_or_malformed_result"}
 
-                    _otc = { "type": "function_call_output", "call_id": tc_id, "output": json.dumps(output_to_emit, ensure_ascii=False) }
+                    # orion: Serialize the tool output exactly once, compactly; the same record (and string) is shared by the
+                    # history sink and the in-flight message list, so neither path re-encodes the tool payload.
+                    _otc = {
+                        "type": "function_call_output",
+                        "call_id": tc_id,
+                        "output": dumps_compact(output_to_emit),
+                    }
                     _sink(_otc)
                     local_messages.append(_otc)
+                    new_items.append(_otc)
+
+                if sink_buffer:
+                    message_batch_sink(sink_buffer)
+                sink_buffer = None
 
                 # orion: Loop back to let the model continue after tool outputs are present in context.
                 continue
@@ -677,7 +1012,8 @@ class ChatCompletionsClient:
 
 
 
-# orion: Add a docstring to clarify intent, parameters, and failure behavior (non-throwing; logs to stderr via prints).
+# orion: Add a docstring to clarify intent, parameters, and failure behavior (non-throwing and silent, since it runs on the
+# .httpcalls logging thread where prints would interleave with the interactive console).
 
 def dumpHttpFile(file: str, url: str, method: str, headers: Dict[str, str], obj: Any) -> None:
     """
@@ -688,25 +1024,73 @@ def dumpHttpFile(file: str, url: str, method: str, headers: Dict[str, str], obj:
         url: The target URL of the request.
         method: HTTP verb (GET/POST/...).
         headers: Request headers that will be sent.
-        obj: JSON-serializable body object that will be pretty-printed.
+        obj: Pre-encoded JSON body bytes, written verbatim, or a JSON-serializable
+            object that will be pretty-printed.
 
     Notes:
-        - This helper is best-effort: it catches serialization and I/O errors and
-          prints a descriptive message instead of raising.
-        - The object is serialized with ensure_ascii=False to preserve unicode.
+        - This helper is best-effort: serialization and I/O errors are swallowed
+          (the dump is simply missing or partial) and nothing is printed.
+        - Objects are serialized with ensure_ascii=False to preserve unicode.
     """
     try:
-        # orion: Serialize payload deterministically with indentation for readability.
-        json_str = json.dumps(obj, indent=2, ensure_ascii=False)
-        with open(file, "w", encoding="utf-8") as f:
+        # orion: Bytes are the already-encoded request body; only objects are serialized, with indentation for readability.
+        if isinstance(obj, (bytes, bytearray)):
+            body = bytes(obj)
+        else:
+            body = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        head = f"{method.upper()} {url}\n" + "".join(f"{key}: {value}\n" for key, value in headers.items()) + "\n"
+        with open(file, "wb") as f:
             # orion: Write request line followed by headers and body for standard debugging format.
-            f.write(f"{method.upper()} {url}\n")
-            for key, value in headers.items():
-                f.write(f"{key}: {value}\n")
-            f.write("\n")
-            f.write(json_str)
-        print(f"HTTP request successfully dumped to {file}")
-    except TypeError as e:
-        print(f"Error: The object could not be serialized to JSON. Details: {e}")
-    except OSError as e:
-        print(f"Error: Could not write to file {file}. Details: {e}")
+            f.write(head.encode("utf-8"))
+            f.write(body)
+    except (TypeError, ValueError, OSError):
+        pass
+
+
+# orion: .httpcalls writers run on the client's logging thread (see ChatCompletionsClient._log_pool); all are
+# best-effort and never raise.
+def _write_http_request(file: pathlib.Path, url: str, headers: Dict[str, str], body: bytes) -> None:
+    """Dump the exact request body sent, or an indented re-encoding of it when ORION_HTTP_DUMP_PRETTY is set."""
+    try:
+        dumpHttpFile(str(file), url, "POST", headers, json.loads(body) if ORION_HTTP_DUMP_PRETTY else body)
+    except Exception:
+        pass
+
+
+def _append_http_bytes(file: pathlib.Path, data: bytes) -> None:
+    """Append raw bytes to a .httpcalls file."""
+    try:
+        with open(file, "ab") as f:
+            f.write(data)
+    except Exception:
+        pass
+
+
+def _append_http_response(
+    file: pathlib.Path, elapsed_ms: int, status: int, reason: str, headers: List[Tuple[str, str]], content: bytes
+) -> None:
+    """Append a response section: elapsed time, status line, headers, and the raw body bytes received."""
+    # orion: The body is written as received; r.text would decode a second full copy of it (after charset sniffing
+    # when the server names no charset) only to re-encode it for the file.
+    head = [
+        "\n\n### Response — elapsed_ms: " + str(elapsed_ms) + "\n",
+        # Best-effort HTTP status line; requests doesn't expose HTTP version reliably.
+        f"HTTP/1.1 {status} {reason}\n",
+    ]
+    head.extend(f"{hk}: {hv}\n" for hk, hv in headers)
+    head.append("\n")
+    try:
+        with open(file, "ab", buffering=65536) as f:
+            f.write("".join(head).encode("utf-8"))
+            f.write(content)
+    except Exception:
+        pass
+
+
+def _append_http_json(file: pathlib.Path, obj: Any) -> None:
+    """Append a JSON object (a streamed call's final response), indented when ORION_HTTP_DUMP_PRETTY is set."""
+    try:
+        text = json.dumps(obj, indent=2, ensure_ascii=False) if ORION_HTTP_DUMP_PRETTY else dumps_compact(obj)
+        _append_http_bytes(file, text.encode("utf-8"))
+    except Exception:
+        pass
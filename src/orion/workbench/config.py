@@ -20,6 +20,15 @@ CONV_CAP_TURNS = int(os.environ.get("ORION_CONV_CAP_TURNS", "200"))
 # Summaries max bytes
 SUMMARY_MAX_BYTES = int(os.environ.get("ORION_SUMMARY_MAX_BYTES", str(2_000_000)))  # 2 MB default
 
+# orion: Concurrent per-file summarization requests during a refresh (1 restores sequential behavior).
+SUMMARY_PARALLELISM = int(os.environ.get("ORION_SUMMARY_PARALLELISM", "8"))
+
+# orion: Process-wide switch for .httpcalls request/response dumps: "1" forces them on, "0" forces them off with no
+# filesystem checks at all; unset defers to settings logging.httpcalls and the existing-directory convention.
+ORION_HTTP_DUMP = os.environ.get("ORION_HTTP_DUMP", "").strip().lower()
+# orion: Indent .httpcalls request/response bodies for reading; by default the exact compact bytes sent are dumped.
+ORION_HTTP_DUMP_PRETTY = os.environ.get("ORION_HTTP_DUMP_PRETTY", "").strip().lower() not in ("", "0", "false", "no", "off")
+
 # orion: Keep POS TTL as an environment-driven knob; this remains independent of how the external directory is provided.
 # Optional: TTL in seconds to force POS regeneration even if hash matches (omit/0 to disable)
 ORION_DEP_TTL_SEC = int(os.environ.get("ORION_DEP_TTL_SEC", "0") or "0")
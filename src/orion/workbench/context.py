@@ -1,11 +1,12 @@
 # orion: Moved user I/O Context and repository Storage (metadata and history) out of editor.py to encapsulate persistence and console I/O concerns. Added docstrings and inline comments documenting metadata defaults/merging and history rotation.
 
+import os
 import pathlib
 import shutil
 from typing import Any, Dict, List, Optional
 
 from .config import CONV_CAP_TURNS
-from .fs import now_ts, short_id, read_json, write_json, append_jsonl, read_jsonl
+from .fs import now_ts, short_id, read_json, write_json, append_jsonl, append_jsonl_many, read_last_n_jsonl
 
 
 # orion: Add class-level docstring and method docstrings to clarify responsibilities of Context (console I/O and logging only).
@@ -69,6 +70,8 @@ class Storage:
             "batches_since_last_consolidation": 0,
             # summaries support
             "path_to_digest": {},
+            # rel path -> [mtime_ns, size] observed when the digest was last confirmed
+            "path_to_stat": {},
             # archived conversation summaries
             "conversation_archives": [],
         }
@@ -90,6 +93,8 @@ class Storage:
             md["batches_since_last_consolidation"] = 0
         if "path_to_digest" not in md:
             md["path_to_digest"] = {}
+        if "path_to_stat" not in md:
+            md["path_to_stat"] = {}
         if "conversation_archives" not in md:
             md["conversation_archives"] = []
         # purge any legacy keys if present
@@ -104,11 +109,8 @@ class Storage:
     # orion: Add docstring and comment on trimming to CONV_CAP_TURNS for bounded history size.
     def load_history(self) -> List[Dict[str, Any]]:
         """Load the conversation history (JSONL) and trim to CONV_CAP_TURNS most recent entries."""
-        hist = read_jsonl(self.conv_file)
-        if len(hist) > CONV_CAP_TURNS:
-            # orion: Keep only the most recent N items to cap memory and token usage.
-            hist = hist[-CONV_CAP_TURNS:]
-        return hist
+        # orion: Keep only the most recent N items to cap memory and token usage; large logs are read from the tail.
+        return read_last_n_jsonl(self.conv_file, CONV_CAP_TURNS)
 
     # orion: Document convenience wrapper for appending a common shape (role/content plus timestamp). 
     def append_history(self, role: str, content: str, extra: Optional[Dict[str, Any]] = None) -> None:
@@ -116,7 +118,7 @@ class Storage:
         entry = {"ts": now_ts(), "role": role, "content": content}
         if extra:
             entry.update(extra)
-        append_jsonl(self.conv_file, entry)
+        self._write_entries([entry])
 
     # orion: Existing docstring retained; clarify that this preserves raw tool_call structures for exact replay.
     def append_raw_message(self, msg: Dict[str, Any]) -> None:
@@ -129,7 +131,25 @@ class Storage:
             raise ValueError("append_raw_message requires a message of type 'message', 'function_call', or 'function_call_output'")
         entry = dict(msg)
         entry.setdefault("ts", now_ts())
-        append_jsonl(self.conv_file, entry)
+        self._write_entries([entry])
+
+    # orion: Batched counterpart of append_raw_message; one file append for a whole tool turn.
+    def append_raw_messages(self, msgs: List[Dict[str, Any]]) -> None:
+        """Append several raw chat messages to the conversation log in order with a single write."""
+        entries: List[Dict[str, Any]] = []
+        for msg in msgs:
+            if msg.get("type") not in ("message", "function_call", "function_call_output"):
+                raise ValueError("append_raw_messages requires messages of type 'message', 'function_call', or 'function_call_output'")
+            entry = dict(msg)
+            entry.setdefault("ts", now_ts())
+            entries.append(entry)
+        self._write_entries(entries)
+
+    def _write_entries(self, entries: List[Dict[str, Any]]) -> None:
+        if len(entries) == 1:
+            append_jsonl(self.conv_file, entries[0])
+        else:
+            append_jsonl_many(self.conv_file, entries)
 
     # orion: Add docstring explaining rotation behavior and rationale (keeps a backup for debugging/audit).
     def clear_history(self, archive_id: Optional[str] = None) -> Optional[pathlib.Path]:
@@ -143,6 +163,10 @@ class Storage:
         if self.conv_file.exists():
             suffix = archive_id if archive_id else str(int(now_ts()))
             backup = self.conv_file.with_name(f"{self.conv_file.stem}-{suffix}.bak.jsonl")
-            shutil.move(str(self.conv_file), str(backup))
+            # orion: Same-directory rotation is a single rename; shutil.move only for the unexpected cross-device case.
+            try:
+                os.replace(self.conv_file, backup)
+            except OSError:
+                shutil.move(str(self.conv_file), str(backup))
             return backup
         return None
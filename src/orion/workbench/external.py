@@ -1,5 +1,7 @@
 # orion: Extracted external Project Description (PD) and Project Orion Summary (POS) helpers to isolate external directory management and hashing concerns. Added docstrings and comments to clarify assumptions and error handling.
 
+import functools
+import json
 import os
 import pathlib
 from typing import Any, Dict, List, Optional
@@ -64,12 +66,21 @@ def read_pos(ext_root: pathlib.Path, filename: str) -> Optional[Dict[str, Any]]:
         The POS dict if available and valid JSON; otherwise None.
     """
     p = pos_path_for_filename(ext_root, filename)
-    if not p.exists():
+    # orion: One stat (no separate exists() probe) keys the parse cache below; a rewritten POS changes mtime/size.
+    try:
+        st = os.stat(p)
+    except OSError:
         return None
+    return _load_pos(str(p), st.st_mtime_ns, st.st_size)
+
+
+# orion: get_project_orion_summary is called repeatedly for the same PDs during planning loops; parse each POS file
+# once per (mtime_ns, size) instead of on every call. The returned dict is shared between callers, which only read it.
+@functools.lru_cache(maxsize=2048)
+def _load_pos(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
     try:
-        import json
-        with p.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return json.loads(f.read())
     except Exception:
         # orion: Corrupt or partially written POS is treated as missing; regeneration will be attempted by callers.
         return None
@@ -1,14 +1,16 @@
 # orion: Split filesystem helpers, time/id utilities, JSON helpers, hashing, and git-aware file listing from editor.py into a dedicated module to decouple IO concerns from Orion logic. Additionally, add .orionignore support to prevent listing and access to ignored files, ensuring privacy and control over Orion's file operations. Added docstrings across public helpers and detailed comments around ignore parsing and safety checks.
 
+import functools
 import hashlib
 import json
 import os
 import pathlib
 import subprocess
+import sys
 import time
 import uuid
 # orion: Extend typing imports to support types used in .orionignore caching and matcher utilities.
-from typing import Any, List, Tuple, Optional, Callable, Dict
+from typing import Any, List, Tuple, Optional, Callable, Dict, Iterable, Iterator
 
 
 # orion: Document that now_ts is used for timestamping logs and file rotations.
@@ -24,11 +26,24 @@ def short_id(prefix: str) -> str:
 
 
 # orion: Note: normalized to POSIX for consistent wire format and matching.
+# orion: Pure and called for every path in listings and on every tool entry; memoize so revisited paths skip the
+# pathlib construction.
+@functools.lru_cache(maxsize=4096)
 def normalize_path(p: str) -> str:
     """Normalize a filesystem path to POSIX-style string (forward slashes)."""
     return str(pathlib.Path(p).as_posix())
 
 
+# orion: Single encoder for JSON embedded in model messages (system_state, apply payloads): compact separators and
+# raw UTF-8, since these strings are escaped again into every request body and history line.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize obj to compact JSON text (no insignificant whitespace, non-ASCII kept as-is)."""
+    return _COMPACT_ENCODER.encode(obj)
+
+
 # orion: Document tolerant JSON read with default fallback to keep callers simple.
 def read_json(path: pathlib.Path, default: Any) -> Any:
     """Read JSON from path; return default if file is missing or invalid."""
@@ -59,6 +74,17 @@ def append_jsonl(path: pathlib.Path, obj: Any) -> None:
         f.write(json.dumps(obj, ensure_ascii=False) + "\n")
 
 
+# orion: Batched variant so callers emitting several records at once pay for a single open/write/close.
+def append_jsonl_many(path: pathlib.Path, objs: Iterable[Any]) -> None:
+    """Append several JSON objects, one per line, to a JSONL file with a single write."""
+    data = "".join(json.dumps(obj, ensure_ascii=False) + "\n" for obj in objs)
+    if not data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(data)
+
+
 # orion: Tolerant line-by-line parser; invalid lines are skipped quietly to keep history robust.
 def read_jsonl(path: pathlib.Path) -> List[Any]:
     """Read a JSONL file into a list of parsed objects; returns [] if missing."""
@@ -77,6 +103,48 @@ def read_jsonl(path: pathlib.Path) -> List[Any]:
     return lines
 
 
+# orion: Tail reader for capped histories; reads backwards in blocks so only the last n records are decoded.
+_TAIL_BLOCK = 64 * 1024
+_TAIL_MIN_BYTES = 1024 * 1024
+
+
+def read_last_n_jsonl(path: pathlib.Path, n: int) -> List[Any]:
+    """Return the last n parsed objects of a JSONL file (same skipping rules as read_jsonl)."""
+    if n <= 0:
+        return []
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return []
+    if size < _TAIL_MIN_BYTES:
+        return read_jsonl(path)[-n:]
+
+    found: List[Any] = []
+    with path.open("rb") as f:
+        pos = size
+        partial = b""
+        while pos > 0 and len(found) < n:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + partial
+            lines = chunk.split(b"\n")
+            # The first piece may be an incomplete line unless we reached the start of the file.
+            partial = lines.pop(0) if pos > 0 else b""
+            for raw in reversed(lines):
+                raw = raw.strip()
+                if not raw:
+                    continue
+                try:
+                    found.append(json.loads(raw))
+                except Exception:
+                    continue
+                if len(found) >= n:
+                    break
+    found.reverse()
+    return found
+
+
 # orion: Document behavior for text with/without trailing newline.
 def count_lines(s: str) -> int:
     """Return the number of lines in a string, handling trailing newline gracefully."""
@@ -92,6 +160,14 @@ def sha256_bytes(data: bytes) -> str:
     h.update(data)
     return h.hexdigest()
 
+
+# orion: Streaming variant for change detection; hashlib.file_digest reads through a fixed buffer in C, so the file
+# is never materialized as one Python bytes object.
+def sha256_file(path: pathlib.Path) -> str:
+    """Compute a hex sha256 digest of a file's contents without loading it into memory."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 # orion: Add helpers and cache for .orionignore support. We parse patterns once per repo_root and reuse until the file changes.
 _ORIONIGNORE_CACHE: Dict[pathlib.Path, Tuple[Optional[float], List[Tuple[bool, str]]]] = {}
 
@@ -277,7 +353,53 @@ def list_repo_paths(repo_root: pathlib.Path) -> List[str]:
         apply .orionignore rules via _is_ignored_rel.
       - If Git is unavailable or fails, fall back to an os.walk that prunes
         .git and .orion directories, and then applies .orionignore.
+
+    A listing taken within the last _LIST_CACHE_TTL_SEC seconds is reused
+    (see invalidate_repo_paths).
     """
+    cached = _fresh_listing(repo_root)
+    if cached is not None:
+        return list(cached)
+    return list(iter_repo_paths(repo_root))
+
+
+# orion: The model often calls list_paths/search_files several times within one turn; reuse a complete listing for a
+# couple of seconds instead of re-running git ls-files and .orionignore matching. Paths are interned once when cached,
+# so every reuse shares the same string objects. Orion drops the entry itself after it writes files.
+_LIST_CACHE_TTL_SEC = 2.0
+_LIST_CACHE: Dict[pathlib.Path, Tuple[float, Tuple[str, ...]]] = {}
+
+
+def _fresh_listing(repo_root: pathlib.Path) -> Optional[Tuple[str, ...]]:
+    hit = _LIST_CACHE.get(repo_root)
+    if hit is not None and time.monotonic() - hit[0] < _LIST_CACHE_TTL_SEC:
+        return hit[1]
+    return None
+
+
+def repo_paths_snapshot(repo_root: pathlib.Path) -> Optional[Tuple[str, ...]]:
+    """Return the cached listing for repo_root if still fresh, else None; its identity changes on every relisting."""
+    return _fresh_listing(repo_root)
+
+
+def invalidate_repo_paths(repo_root: Optional[pathlib.Path] = None) -> None:
+    """Drop the cached listing for repo_root (or for every root when None)."""
+    if repo_root is None:
+        _LIST_CACHE.clear()
+    else:
+        _LIST_CACHE.pop(repo_root, None)
+
+
+# orion: Lazy form of list_repo_paths, yielding the same paths in the same (sorted) order. Discovery and the cheap
+# internal-file filter run up front; the comparatively costly .orionignore matching runs per path as it is consumed,
+# so a caller that stops early (e.g. after a result cap) never evaluates the rules for the rest of the repository.
+def iter_repo_paths(repo_root: pathlib.Path) -> Iterator[str]:
+    """Yield non-ignored repo-relative file paths (POSIX) in sorted order; see list_repo_paths."""
+    cached = _fresh_listing(repo_root)
+    if cached is not None:
+        yield from cached
+        return
+    started = time.monotonic()
     # orion: Prefer Git for parity with developer workflows and to respect .gitignore out of the box; gracefully degrade to a filesystem walk if Git is not usable.
     rc, out, _ = run_git(["rev-parse", "--is-inside-work-tree"], repo_root)
 
@@ -287,43 +409,43 @@ def list_repo_paths(repo_root: pathlib.Path) -> List[str]:
             return True
         return ".orion" in pathlib.Path(p).parts
 
+    candidates: Optional[List[str]] = None
     if rc == 0 and out.strip() == "true":
         rc_ls, out_ls, _err_ls = run_git(
             ["ls-files", "-z", "--exclude-standard", "--others", "--cached"],
             repo_root,
         )
         if rc_ls == 0:
-            git_paths = [p for p in out_ls.split("\x00") if p]
-            results: List[str] = []
-            for rel in git_paths:
-                if _is_internal(rel):
+            candidates = [normalize_path(p) for p in out_ls.split("\x00") if p and not _is_internal(p)]
+
+    if candidates is None:
+        # Fallback: filesystem walk
+        candidates = []
+        for root, dirs, files in os.walk(repo_root):
+            # prune .git and any colocated .orion directories
+            dirs[:] = [d for d in dirs if d not in (".git", ".orion")]
+            for name in files:
+                full = pathlib.Path(root) / name
+                rel = os.path.relpath(full, repo_root)
+                # Skip Orion internal files (we keep them untracked ideally)
+                if rel.endswith("orion-metadata.json") or rel.endswith("orion-conversation.jsonl"):
                     continue
-                rel_posix = normalize_path(rel)
-                if _is_ignored_rel(repo_root, rel_posix):
+                # Skip any file that is within a .orion folder
+                parts = pathlib.Path(rel).parts
+                if ".orion" in parts:
                     continue
-                results.append(rel_posix)
-            return sorted(results)
-
-    # Fallback: filesystem walk
-    paths: List[str] = []
-    for root, dirs, files in os.walk(repo_root):
-        # prune .git and any colocated .orion directories
-        dirs[:] = [d for d in dirs if d not in (".git", ".orion")]
-        for name in files:
-            full = pathlib.Path(root) / name
-            rel = os.path.relpath(full, repo_root)
-            # Skip Orion internal files (we keep them untracked ideally)
-            if rel.endswith("orion-metadata.json") or rel.endswith("orion-conversation.jsonl"):
-                continue
-            # Skip any file that is within a .orion folder
-            parts = pathlib.Path(rel).parts
-            if ".orion" in parts:
-                continue
-            # orion: Exclude files matched by .orionignore when walking the filesystem.
-            if _is_ignored_rel(repo_root, normalize_path(rel)):
-                continue
-            paths.append(normalize_path(rel))
-    return sorted(paths)
+                candidates.append(normalize_path(rel))
+
+    candidates.sort()
+    kept: List[str] = []
+    for rel_posix in candidates:
+        # orion: Exclude files matched by .orionignore, whichever source produced the listing.
+        if not _is_ignored_rel(repo_root, rel_posix):
+            rel_posix = sys.intern(rel_posix)
+            kept.append(rel_posix)
+            yield rel_posix
+    # Only a fully consumed listing is complete enough to cache.
+    _LIST_CACHE[repo_root] = (started, tuple(kept))
 
 
 # orion: Clarify the colocated path scheme for per-file summaries.
@@ -337,6 +459,14 @@ def colocated_summary_path(repo_root: pathlib.Path, rel_path: str) -> pathlib.Pa
     summary_name = rel.name + ".json"
     return (repo_root / summary_dir / summary_name).resolve()
 
+
+# orion: String-only variant for bulk reads (system_state builds over the whole listing): os.path joins avoid the
+# per-file Path objects and the resolve() syscalls; rel_path is already a normalized POSIX repo path.
+def colocated_summary_file(repo_root: str, rel_path: str) -> str:
+    """Return the colocated summary path for rel_path as a plain string under repo_root (no symlink resolution)."""
+    head, _, name = rel_path.rpartition("/")
+    return os.path.join(repo_root, head, ".orion", name + ".json")
+
 # -----------------------------
 # Git helpers for file discovery
 # -----------------------------
@@ -1,26 +1,29 @@
 # orion: Replace bootstrap flow with a persistent, authoritative system_state message and ensure it is included at the front of every model call. Add builders/helpers to create, ensure, and select the latest system_state, and update handle_user_input/apply to use it.
 
 import pathlib
-import sys
 
 # orion: Ported the core Orion class, tool definitions, command handlers, bootstrap/summaries flow, and change-spec validators from editor.py into a focused module. Adjusted imports to use the new modular structure. Externalized conversation/apply system prompts via orion.prompts.get_prompt. Added docstrings and inline comments where flow or validation is non-obvious.
 
 import json
+import os
 import pathlib
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .config import LINE_CAP
 from .context import Context, Storage
 from .client import ChatCompletionsClient
 from .external import ext_dir_valid, list_project_descriptions
 from .fs import (
+    invalidate_repo_paths,
     list_all_nonignored_files,
     normalize_path,
     read_file,
     write_file,
     count_lines,
-    colocated_summary_path,
+    colocated_summary_file,
+    dumps_compact,
     now_ts,
     short_id,
 )
@@ -69,10 +72,14 @@ def make_change_item(path: str, change_type: str, summary_of_change: str) -> Dic
 
 # orion: Simplify validators by delegating to Pydantic models; retained as thin wrappers for compatibility.
 
+# orion: Build the list adapter once; constructing a TypeAdapter compiles a core schema and dominates per-call cost.
+_CHANGE_SPEC_LIST_ADAPTER: TypeAdapter[List[ChangeSpec]] = TypeAdapter(List[ChangeSpec])
+
+
 def validate_change_specs(changes: Any) -> List[Dict[str, Any]]:
     """Validate a list of change specs using Pydantic and return normalized dicts."""
     try:
-        parsed: List[ChangeSpec] = TypeAdapter(List[ChangeSpec]).validate_python(changes)
+        parsed: List[ChangeSpec] = _CHANGE_SPEC_LIST_ADAPTER.validate_python(changes)
     except ValidationError:
         return []
     # Ensure enum values are dumped as strings and paths are normalized via model validators.
@@ -88,44 +95,73 @@ def validate_apply_response(resp: Dict[str, Any]) -> (bool, str):
         return False, str(e)
 
 
+# orion: Response schemas are derived from static models; generate them once at import instead of every turn.
+# The client's strict-mode preprocessing never mutates its input: it copies only the nodes it changes (sharing the
+# rest) and caches the result by the source dict's identity, so sharing these dicts is safe as long as they stay unmodified.
+_CONVERSATION_SCHEMA: Dict[str, Any] = ConversationResponse.model_json_schema()
+_APPLY_SCHEMA: Dict[str, Any] = ApplyResponse.model_json_schema()
+_INFO_SUMMARY_SCHEMA: Dict[str, Any] = InfoSummary.model_json_schema()
+
+
 # -----------------------------
 # Tools exposed to the model (definitions)
 # -----------------------------
 
 # orion: Provide external dependency tool schemas; internal tools are discovered via reflection and get a synthetic reason_for_call injected solely in their model schema.
 
-def _external_tool_definitions() -> List[Dict[str, Any]]:
-    return [
-        {
-            "type": "function",
-            "name": "list_project_descriptions",
-            "description": "List dependency Project Descriptions (filenames) from the external directory.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    # orion: Synthetic reason_for_call is exposed to the model but stripped before invocation.
-                    "reason_for_call": {"type": "string"},
-                },
-                "required": [],
-                "additionalProperties": False,
+_EXTERNAL_TOOL_DEFS: Tuple[Dict[str, Any], ...] = (
+    {
+        "type": "function",
+        "name": "list_project_descriptions",
+        "description": "List dependency Project Descriptions (filenames) from the external directory.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                # orion: Synthetic reason_for_call is exposed to the model but stripped before invocation.
+                "reason_for_call": {"type": "string"},
             },
+            "required": [],
+            "additionalProperties": False,
         },
-        {
-            "type": "function",
-            "name": "get_project_orion_summary",
-            "description": "Return the Project Orion Summary (POS) for a given PD filename; regenerates if stale.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    # orion: Synthetic reason_for_call for consistency with internal tools.
-                    "reason_for_call": {"type": "string"},
-                },
-                "required": ["filename"],
-                "additionalProperties": False,
+    },
+    {
+        "type": "function",
+        "name": "get_project_orion_summary",
+        "description": "Return the Project Orion Summary (POS) for a given PD filename; regenerates if stale.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                # orion: Synthetic reason_for_call for consistency with internal tools.
+                "reason_for_call": {"type": "string"},
             },
+            "required": ["filename"],
+            "additionalProperties": False,
         },
-    ]
+    },
+)
+
+
+def _external_tool_definitions() -> List[Dict[str, Any]]:
+    # orion: Return a fresh list over the shared, never-mutated definitions built at import.
+    return list(_EXTERNAL_TOOL_DEFS)
+
+
+# orion: Colocated summary loading for system_state; read bytes and decode in one step (a missing file is just None),
+# which avoids a separate exists() probe and the text-wrapper overhead of json.load.
+_SUMMARY_LOAD_PARALLEL_MIN = 64
+_SUMMARY_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# orion: Persist metadata after this many new summaries during a refresh (and once at the end).
+_SUMMARY_CHECKPOINT_EVERY = 50
+
+
+def _load_summary(sp: str) -> Optional[Any]:
+    try:
+        with open(sp, "rb") as f:
+            return json.loads(f.read())
+    except Exception:
+        return None
 
 
 # -----------------------------
@@ -155,7 +191,12 @@ class Orion:
         self.repo_root = repo_root.resolve()
         self.storage = Storage(self.repo_root)
         self.md = self.storage.load_metadata()
-        self.history = self.storage.load_history()
+        # orion: Keep the in-memory history in wire shape. Only entries loaded from disk carry the persisted "ts" field
+        # (messages appended this session never do), so strip it once here instead of copying every entry per turn.
+        self.history = [
+            {k: v for k, v in m.items() if k != "ts"} if "ts" in m else m
+            for m in self.storage.load_history()
+        ]
         # orion: Load settings once; expose on Context and use for client overrides.
         self.settings = load_settings(self.repo_root)
         # orion: Autodetect provider and values in the client using settings and env; no need to pass base_url explicitly.
@@ -167,6 +208,38 @@ class Orion:
         # orion: Discover internal tools reflectively and keep a name set for dispatch.
         self.internal_tool_specs = discover_tools()
         self.internal_tool_names = set(list_tool_names())
+        # orion: Full tool list for model calls (internal + external PD tools), built once; the client never mutates it.
+        self.tool_specs: List[Dict[str, Any]] = [*self.internal_tool_specs, *_external_tool_definitions()]
+        # orion: Non-ignored file listing shared by refresh/system_state/status/apply within one REPL turn. Dropped at
+        # the start of each turn and after Orion writes files.
+        self._files_cache: Optional[Tuple[str, ...]] = None
+        # orion: (file listing, path -> summary) from the last system_state build, plus paths re-summarized since.
+        self._summary_cache: Optional[Tuple[Tuple[str, ...], Dict[str, Any]]] = None
+        self._stale_summaries: set[str] = set()
+        # orion: Bumped whenever the cached summaries change; keys the serialized system_state cache below.
+        self._summary_version = 0
+        self._state_content_cache: Optional[Tuple[Tuple[int, str], str]] = None
+        # orion: path -> ((mtime_ns, size) or None, full files entry) read by the last :apply, for retries.
+        self._apply_reads: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[str, Any]]] = {}
+        # orion: REPL commands that take no arguments, dispatched by exact name from handle_user_input.
+        self._cmd_table: Dict[str, Callable[[Context], None]] = {
+            ":help": self.cmd_help,
+            ":preview": self.cmd_preview,
+            ":apply": self.cmd_apply,
+            # orion: :history shows a compact display of the last user<->assistant turns.
+            ":history": self.cmd_history,
+            ":previousConversation": self.cmd_previous_conversation,
+            # orion: :rerun replays the most recent user message without creating a duplicate entry.
+            ":rerun": self.cmd_rerun,
+            # orion: Kebab-case and camelCase clear commands share one handler.
+            ":clear-changes": self.cmd_clear_changes,
+            ":clearChanges": self.cmd_clear_changes,
+            ":refresh": self.cmd_refresh,
+            ":reset-state": self.cmd_reset_state,
+            ":refresh-deps": self.cmd_refresh_deps,
+            ":status": self.cmd_status,
+            ":consolidate": self.cmd_consolidate,
+        }
 
     # ---------- External tools (flat) ----------
 
@@ -198,20 +271,56 @@ class Orion:
 
     # ---------- System State helpers ----------
 
+    # orion: One REPL turn lists the repo several times (refresh, then system_state); walk the tree once per turn
+    # and share the immutable listing by reference instead of re-running git ls-files and .orionignore filtering.
+    def _get_files(self) -> Tuple[str, ...]:
+        """Return the non-ignored repo files, listing the tree only if the cache was invalidated."""
+        files = self._files_cache
+        if files is None:
+            files = self._files_cache = tuple(list_all_nonignored_files(self.repo_root))
+        return files
+
+    def _invalidate_files(self) -> None:
+        """Drop the cached file listing (new REPL turn, after writes, or on explicit refresh)."""
+        self._files_cache = None
+        # orion: The tools' short-lived listing (fs.list_repo_paths) must not outlive Orion's own writes either.
+        invalidate_repo_paths(self.repo_root)
+
+    # orion: Summaries loaded for the last system_state build. While the file listing is unchanged, later builds only
+    # re-read the summaries _refresh_summaries rewrote since then (tracked in _stale_summaries).
+    def _load_summaries(self, files: Tuple[str, ...]) -> Dict[str, Any]:
+        cached = self._summary_cache
+        if cached is not None and (cached[0] is files or cached[0] == files):
+            by_path = cached[1]
+            for p in self._stale_summaries:
+                if p in by_path:
+                    by_path[p] = _load_summary(colocated_summary_file(str(self.repo_root), p))
+                    self._summary_version += 1
+        else:
+            root = str(self.repo_root)
+            summary_paths = [colocated_summary_file(root, p) for p in files]
+            # orion: Summary reads are independent blocking I/O; fan them out over a small pool for larger repos.
+            # map() preserves input order, so the mapping keeps the listing order.
+            if len(summary_paths) >= _SUMMARY_LOAD_PARALLEL_MIN:
+                with ThreadPoolExecutor(max_workers=_SUMMARY_LOAD_WORKERS, thread_name_prefix="orion-summary") as pool:
+                    summaries = list(pool.map(_load_summary, summary_paths))
+            else:
+                summaries = [_load_summary(sp) for sp in summary_paths]
+            by_path = dict(zip(files, summaries, strict=True))
+            self._summary_cache = (files, by_path)
+            self._summary_version += 1
+        self._stale_summaries.clear()
+        return by_path
+
+    def _invalidate_summaries(self) -> None:
+        """Force the next system_state build to re-read every colocated summary."""
+        self._summary_cache = None
+        self._stale_summaries.clear()
+
     # orion: Build the authoritative system_state from current repo paths and colocated summaries.
     def _build_system_state_message(self, ctx: Context) -> Dict[str, Any]:
-        files = list_all_nonignored_files(self.repo_root)
-        files_map: Dict[str, Any] = {}
-        for p in files:
-            summ = None
-            sp = colocated_summary_path(self.repo_root, p)
-            if sp.exists():
-                try:
-                    with sp.open("r", encoding="utf-8") as f:
-                        summ = json.load(f)
-                except Exception:
-                    summ = None
-            files_map[p] = {"kind": "summary", "body": summ, "meta": {"has_summary": bool(summ)}}
+        files = self._get_files()
+        summaries = self._load_summaries(files)
         # Conversations: include last 5 archived summaries (id, ts, s)
         archives = self.md.get("conversation_archives", []) if isinstance(self.md, dict) else []
         recent_archives = archives[-5:] if archives else []
@@ -241,6 +350,16 @@ class Orion:
             # orion: Missing or unreadable downloads.yaml is treated as no downloads.
             pass
 
+        # orion: The files map dominates the serialized state. When the summaries are unchanged (same version) and the
+        # small remaining sections serialize identically, reuse the previous content string instead of re-encoding it.
+        key = (self._summary_version, dumps_compact([conv_obj, pending_changes, downloads_names]))
+        if self._state_content_cache is not None and self._state_content_cache[0] == key:
+            return {"type": "message", "role": "system", "content": self._state_content_cache[1]}
+
+        files_map: Dict[str, Any] = {}
+        for p in files:
+            summ = summaries[p]
+            files_map[p] = {"kind": "summary", "body": summ, "meta": {"has_summary": bool(summ)}}
         payload: Dict[str, Any] = {
             "type": "system_state",
             "version": 1,
@@ -249,9 +368,13 @@ class Orion:
             "pending_changes": pending_changes,
             "downloads": {"names": downloads_names},
         }
-        return {"type": "message", "role": "system", "content": json.dumps(payload, ensure_ascii=False)}
+        content = dumps_compact(payload)
+        self._state_content_cache = (key, content)
+        return {"type": "message", "role": "system", "content": content}
 
     # orion: Ensure a system_state is present as the first stored message; refresh colocated summaries first.
+    # The refresh stays on every call so edits made between turns are picked up; with the stat shortcut it only reads
+    # changed files, and the rebuild below re-reads just the summaries it rewrote.
     def _ensure_system_state(self, ctx: Context) -> None:
         self._refresh_summaries(ctx)
         new_state_msg = self._build_system_state_message(ctx)
@@ -279,9 +402,13 @@ class Orion:
                 continue
             try:
                 content = msg.get("content", "")
-                obj = json.loads(content) if isinstance(content, str) else None
+                # orion: Cheap substring test first; only messages that can be a system_state are JSON-parsed.
+                if not isinstance(content, str) or "system_state" not in content:
+                    continue
+                obj = json.loads(content)
                 if isinstance(obj, dict) and obj.get("type") == "system_state":
-                    return {"type": "message", "role": "system", "content": json.dumps(obj, ensure_ascii=False)}
+                    # orion: Reuse the stored JSON text; re-encoding the parsed object would only reproduce it.
+                    return {"type": "message", "role": "system", "content": content}
             except Exception:
                 continue
         return None
@@ -331,12 +458,13 @@ class Orion:
 
     def cmd_discard_change(self, ctx: Context, change_id: str) -> None:
         """Remove a single change by id from the pending list and persist metadata."""
-        before = len(self.md["pending_changes"])
-        self.md["pending_changes"] = [c for c in self.md["pending_changes"] if c.get("id") != change_id]
-        after = len(self.md["pending_changes"])
-        if before == after:
+        # orion: Ids are unique (merge replaces by id), so stop at the first match and delete in place.
+        pending = self.md["pending_changes"]
+        idx = next((i for i, c in enumerate(pending) if c.get("id") == change_id), None)
+        if idx is None:
             ctx.send_to_user(f"No change with id {change_id} found.")
         else:
+            del pending[idx]
             self.storage.save_metadata(self.md)
             ctx.send_to_user(f"Discarded change {change_id}.")
 
@@ -349,9 +477,9 @@ class Orion:
         """
         # Determine file list
         if only_paths is not None:
-            files = [normalize_path(p) for p in only_paths]
+            files: Sequence[str] = [normalize_path(p) for p in only_paths]
         else:
-            files = list_all_nonignored_files(self.repo_root)
+            files = self._get_files()
 
         if not files:
             ctx.log("No files found for summarization.")
@@ -359,12 +487,20 @@ class Orion:
 
         path_to_digest = self.md.get("path_to_digest", {})
         self.md["path_to_digest"] = path_to_digest
+        # orion: [mtime_ns, size] recorded alongside each digest; an unchanged stat skips the read + hash entirely.
+        path_to_stat = self.md.get("path_to_stat", {})
+        self.md["path_to_stat"] = path_to_stat
 
         changed: List[str] = []
         skipped = 0
         created = 0
-        from .config import SUMMARY_MAX_BYTES
-        from .fs import _safe_abs, sha256_bytes
+        stats_updated = False
+        # (rel, abs path, stat_key) for files whose stat changed and need hashing
+        to_hash: List[Tuple[str, pathlib.Path, List[int]]] = []
+        # (rel, digest, stat_key) for files whose content changed and need a new summary
+        todo: List[Tuple[str, str, List[int]]] = []
+        from .config import SUMMARY_MAX_BYTES, SUMMARY_PARALLELISM
+        from .fs import _safe_abs, sha256_file
 
         for rel in files:
             # skip our internal .orion dirs (already excluded by listing, but guard anyway)
@@ -373,26 +509,75 @@ class Orion:
             # size cap
             try:
                 ap = _safe_abs(self.repo_root, rel)
-                if ap.stat().st_size > SUMMARY_MAX_BYTES:
+                st = ap.stat()
+                if st.st_size > SUMMARY_MAX_BYTES:
                     skipped += 1
                     continue
             except Exception:
                 continue
-            # compute digest
+            stat_key = [st.st_mtime_ns, st.st_size]
+            prev = path_to_digest.get(rel)
+            if prev is not None and path_to_stat.get(rel) == stat_key:
+                continue
+            to_hash.append((rel, ap, stat_key))
+
+        # orion: hashlib releases the GIL while digesting and file reads block outside it, so a larger batch of
+        # stat-changed files is hashed across cores on a thread pool; map() keeps the listing order.
+        def _digest(ap: pathlib.Path) -> Optional[str]:
             try:
-                b = ap.read_bytes()
+                return sha256_file(ap)
             except Exception:
+                return None
+
+        abs_paths = [ap for _, ap, _ in to_hash]
+        if len(abs_paths) >= _SUMMARY_LOAD_PARALLEL_MIN:
+            with ThreadPoolExecutor(max_workers=_SUMMARY_LOAD_WORKERS, thread_name_prefix="orion-digest") as pool:
+                digests = list(pool.map(_digest, abs_paths))
+        else:
+            digests = [_digest(ap) for ap in abs_paths]
+
+        for (rel, _, stat_key), digest in zip(to_hash, digests, strict=True):
+            if digest is None:
                 continue
-            digest = sha256_bytes(b)
-            prev = path_to_digest.get(rel)
-            need = prev != digest
-            if need:
-                res = summarize_file(ctx, self.client, self.repo_root, rel)
-                if res:
-                    path_to_digest[rel] = digest
-                    changed.append(rel)
-                    created += 1
-                    self.storage.save_metadata(self.md)
+            need = path_to_digest.get(rel) != digest
+            if not need:
+                # Content unchanged (e.g. touched or checked out again); remember the new stat.
+                path_to_stat[rel] = stat_key
+                stats_updated = True
+            else:
+                todo.append((rel, digest, stat_key))
+
+        # orion: Each summary is an independent model round-trip; run them on a bounded pool. Results are consumed
+        # in order on this thread, so metadata is only ever mutated here and needs no lock. A failed file is logged
+        # and left for the next refresh rather than aborting the batch.
+        def _summarize(rel: str) -> Optional[Dict[str, Any]]:
+            try:
+                return summarize_file(ctx, self.client, self.repo_root, rel)
+            except Exception as e:
+                ctx.log(f"Summary failed for {rel}: {e}")
+                return None
+
+        # orion: The final save runs even if the batch is interrupted, so summaries written since the last
+        # checkpoint stay recorded.
+        try:
+            if todo:
+                workers = max(1, min(SUMMARY_PARALLELISM, len(todo)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orion-summarize") as pool:
+                    results = pool.map(_summarize, [rel for rel, _, _ in todo])
+                    for (rel, digest, stat_key), res in zip(todo, results, strict=True):
+                        if res:
+                            path_to_digest[rel] = digest
+                            path_to_stat[rel] = stat_key
+                            changed.append(rel)
+                            self._stale_summaries.add(rel)
+                            created += 1
+                            # orion: Checkpoint periodically so an interrupted initial index keeps most of its work,
+                            # instead of rewriting the whole metadata file after every summary.
+                            if created % _SUMMARY_CHECKPOINT_EVERY == 0:
+                                self.storage.save_metadata(self.md)
+        finally:
+            if stats_updated or created % _SUMMARY_CHECKPOINT_EVERY:
+                self.storage.save_metadata(self.md)
         if only_paths is not None:
             ctx.log(f"Refreshed summaries for {len(changed)} file(s); skipped {skipped} large file(s).")
         else:
@@ -400,6 +585,9 @@ class Orion:
 
     def cmd_refresh(self, ctx: Context) -> None:
         """Refresh summaries for local files and external PDs (if configured)."""
+        # orion: An explicit refresh always rescans the repository and re-reads every summary.
+        self._invalidate_files()
+        self._invalidate_summaries()
         self._refresh_summaries(ctx)
         # Also refresh external dependency POS if configured
         if self.ext_root:
@@ -428,6 +616,7 @@ class Orion:
           - Replay the remaining messages in order
         """
         # orion: Refresh summaries first to ensure the new system_state reflects the latest repo view.
+        self._invalidate_summaries()
         self._refresh_summaries(ctx)
 
         # Build a fresh summaries-only system_state message.
@@ -439,7 +628,7 @@ class Orion:
             if m.get("type") == "message" and m.get("role") == "system":
                 try:
                     content = m.get("content", "")
-                    obj = json.loads(content) if isinstance(content, str) else None
+                    obj = json.loads(content) if isinstance(content, str) and "system_state" in content else None
                     if isinstance(obj, dict) and obj.get("type") == "system_state":
                         continue
                 except Exception:
@@ -448,18 +637,14 @@ class Orion:
 
         # Rewrite stored history: clear, then write new system_state, then replay remaining messages in order.
         self.storage.clear_history()
-        self.history = []
-        self.storage.append_raw_message(new_state_msg)
-        self.history.append(new_state_msg)
-        for m in remaining:
-            self.storage.append_raw_message(m)
-            self.history.append(m)
+        self.storage.append_raw_messages([new_state_msg, *remaining])
+        self.history = [new_state_msg, *remaining]
 
         ctx.send_to_user("Reset system_state from summaries and rebuilt conversation history.")
 
     def cmd_status(self, ctx: Context) -> None:
         """Print a one-line-per-field status report about the current Orion session and repo."""
-        total_files = len(list_all_nonignored_files(self.repo_root))
+        total_files = len(self._get_files())
         dep_count = 0
         if self.ext_root:
             try:
@@ -492,7 +677,9 @@ class Orion:
         seen = set()
         consolidated = []
         for ch in changes:
-            key = (ch["title"], tuple(sorted(it["path"] for it in ch.get("items", []))))
+            # orion: Sorted path tuple as the key: order-insensitive but, unlike a set, it keeps repeated paths, so two
+            # changes that differ only by a duplicated item are not merged.
+            key = (ch["title"], tuple(sorted(it["path"] for it in ch.get("items", ()))))
             if key in seen:
                 continue
             seen.add(key)
@@ -641,7 +828,7 @@ class Orion:
             except Exception:
                 pass
 
-        response_schema = ConversationResponse.model_json_schema()
+        response_schema = _CONVERSATION_SCHEMA
 
         # orion: Build messages by trimming history to the last user message (inclusive), excluding any prior system_state echoes.
         messages: List[Dict[str, Any]] = []
@@ -660,15 +847,10 @@ class Orion:
                 except Exception:
                     pass
             # orion: Replay up to and including the last user message; do not append a new user entry.
-            msg = h.copy()
-            if "ts" in msg:
-                del msg["ts"]
-            messages.append(msg)
+            messages.append(h)
 
         # Tools and runner mirror normal conversation flow
-        tools: List[Dict[str, Any]] = []
-        tools.extend(self.internal_tool_specs)
-        tools.extend(_external_tool_definitions())
+        tools = self.tool_specs
 
         def runner(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
             reason = str(args.get("reason_for_call") or "")
@@ -687,6 +869,10 @@ class Orion:
             self.storage.append_raw_message(msg)
             self.history.append(msg)
 
+        def sink_many(msgs: List[Dict[str, Any]]) -> None:
+            self.storage.append_raw_messages(msgs)
+            self.history.extend(msgs)
+
         ctx.log("Calling model for rerun of the last user message...")
         final_json = self.client.call_responses(
             ctx,
@@ -695,6 +881,7 @@ class Orion:
             response_schema,
             interactive_tool_runner=runner,
             message_sink=sink,
+            message_batch_sink=sink_many,
             call_type="conversation",
         )
 
@@ -729,12 +916,10 @@ class Orion:
             "line_cap": LINE_CAP,
             "content": content,
         }
-        schema = ApplyResponse.model_json_schema()
+        schema = _APPLY_SCHEMA
 
         # Build minimal tool surface (internal + external) for optional lookups.
-        tools: List[Dict[str, Any]] = []
-        tools.extend(self.internal_tool_specs)
-        tools.extend(_external_tool_definitions())
+        tools = self.tool_specs
 
         def runner(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
             reason = str(args.get("reason_for_call") or "")
@@ -784,6 +969,8 @@ class Orion:
             # orion: Field renamed from 'code' to 'contents'; write the new field.
             write_file(self.repo_root, f.path, f.contents)
             written_paths.append(f.path)
+        # orion: Writes may create files; drop the cached listing before anything re-reads it.
+        self._invalidate_files()
         if written_paths:
             self._refresh_summaries(ctx, only_paths=written_paths)
 
@@ -820,22 +1007,6 @@ class Orion:
         # This avoids duplicating raw file text in the user payload and aligns with how get_file_contents promotions work.
         # Steps: read current contents + meta, update the latest system_state.files[path] = {kind:"full", body, meta}, bump version,
         # and use the upgraded system_state as the first message of the apply call.
-        content_map: Dict[str, Dict[str, Any]] = {}
-        for p in sorted(affected):
-            content = ""
-            abs_path = self.repo_root / p
-            if abs_path.exists():
-                try:
-                    content = read_file(self.repo_root, p)
-                except Exception:
-                    content = ""
-            try:
-                bcount = len(content.encode("utf-8"))
-            except Exception:
-                bcount = 0
-            lcount = count_lines(content)
-            content_map[p] = {"content": content, "meta": {"line_count": lcount, "bytes": bcount}}
-
         latest_state = self._latest_system_state_message()
         if not latest_state:
             # Fallback: ensure and rebuild one if missing
@@ -848,22 +1019,46 @@ class Orion:
                 state_obj = None
             if isinstance(state_obj, dict) and state_obj.get("type") == "system_state":
                 files_map = state_obj.get("files") or {}
-                for path_key, info in content_map.items():
-                    entry = files_map.get(path_key)
+                # orion: Consult the state before touching disk; paths already promoted to full are neither re-read
+                # nor re-encoded, so only the contents actually added to the state are ever held in memory.
+                for p in sorted(affected):
+                    entry = files_map.get(p)
                     if isinstance(entry, dict) and entry.get("kind") == "full":
                         # Already full; skip overwrite to avoid redundant churn
                         continue
-                    files_map[path_key] = {
+                    # orion: A retried :apply reuses the entry read last time while the file's stat is unchanged;
+                    # the stat also stands in for the old exists() probe (a missing file is an empty body).
+                    try:
+                        st = (self.repo_root / p).stat()
+                        stat_key: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        stat_key = None
+                    cached_entry = self._apply_reads.get(p)
+                    if cached_entry is not None and cached_entry[0] == stat_key:
+                        files_map[p] = cached_entry[1]
+                        continue
+                    content = ""
+                    if stat_key is not None:
+                        try:
+                            content = read_file(self.repo_root, p)
+                        except Exception:
+                            content = ""
+                    try:
+                        bcount = len(content.encode("utf-8"))
+                    except Exception:
+                        bcount = 0
+                    files_map[p] = {
                         "kind": "full",
-                        "body": info["content"],
-                        "meta": {"line_count": info["meta"]["line_count"], "bytes": info["meta"]["bytes"]},
+                        "body": content,
+                        "meta": {"line_count": count_lines(content), "bytes": bcount},
                     }
+                    self._apply_reads[p] = (stat_key, files_map[p])
                 state_obj["files"] = files_map
                 try:
                     state_obj["version"] = int(state_obj.get("version", 0) or 0) + 1
                 except Exception:
                     state_obj["version"] = 1
-                latest_state = {"type": "message", "role": "system", "content": json.dumps(state_obj, ensure_ascii=False)}
+                latest_state = {"type": "message", "role": "system", "content": dumps_compact(state_obj)}
 
         # orion: Build Apply prompt and a compact user payload that references no raw file contents.
         # We intentionally send an empty files array because the upgraded system_state now carries full contents.
@@ -871,15 +1066,13 @@ class Orion:
 
         # orion: Load Apply system prompt from resources so it can be maintained externally.
         system_text = get_prompt("prompt_apply_system.txt")
-        user_text = json.dumps({"changes": pending, "files": files_payload}, ensure_ascii=False)
+        user_text = dumps_compact({"changes": pending, "files": files_payload})
 
         # orion: Replace inline JSON Schema with centralized Pydantic model schema.
-        response_schema = ApplyResponse.model_json_schema()
+        response_schema = _APPLY_SCHEMA
 
         # orion: Build tools from reflective internal specs + explicit external PD specs.
-        tools = []
-        tools.extend(self.internal_tool_specs)
-        tools.extend(_external_tool_definitions())
+        tools = self.tool_specs
 
         def runner(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
             # orion: Generic runner that injects/strips reason_for_call and returns a wrapped result.
@@ -942,6 +1135,10 @@ class Orion:
             # orion: Field renamed from 'code' to 'contents'; write the new field.
             write_file(self.repo_root, f.path, f.contents)
             written_paths.append(f.path)
+        # orion: Writes may create files; drop the cached listing before anything re-reads it. The applied
+        # changes are gone from pending, so the contents kept for a retry are no longer needed either.
+        self._invalidate_files()
+        self._apply_reads.clear()
 
         # Commit log entry
         self.md["plan_state"]["commit_log"].append(
@@ -972,7 +1169,7 @@ class Orion:
 
             # Summarize via InfoSummary using the archive prompt
             archive_system = get_prompt("prompt_archive_summary_system.txt")
-            archive_schema = InfoSummary.model_json_schema()
+            archive_schema = _INFO_SUMMARY_SCHEMA
             archive_messages = [
                 {"role": "system", "content": archive_system},
                 {"role": "user", "content": json.dumps({"transcript": transcript}, ensure_ascii=False)},
@@ -1108,6 +1305,8 @@ class Orion:
         """
         Handle a line of user input: either execute a command or advance the conversation.
         """
+        # orion: The user may have edited the tree since the last turn; list it afresh (at most once) for this turn.
+        self._invalidate_files()
         # orion: Support per-turn model override via ':model <model> <message>'. Parse this before command routing;
         # on success, strip the directive, log usage, and proceed down the conversation path with an override.
         override_model: Optional[str] = None
@@ -1127,38 +1326,15 @@ class Orion:
         if (not was_model_override) and text.startswith(":"):
             parts = text.strip().split()
             cmd = parts[0]
-            if cmd == ":help":
-                self.cmd_help(ctx)
-            elif cmd == ":preview":
-                self.cmd_preview(ctx)
-            elif cmd == ":apply":
-                self.cmd_apply(ctx)
+            # orion: Argument-free commands dispatch through a table; commands that take arguments stay explicit below.
+            handler = self._cmd_table.get(cmd)
+            if handler is not None:
+                handler(ctx)
             elif cmd == ":discard-change":
                 if len(parts) < 2:
                     ctx.error_message("Usage: :discard-change <id>")
                 else:
                     self.cmd_discard_change(ctx, parts[1])
-            # orion: Route :history to new cmd_history for compact display of last user↔assistant turns.
-            elif cmd == ":history":
-                self.cmd_history(ctx)
-            elif cmd == ":previousConversation":
-                self.cmd_previous_conversation(ctx)
-            # orion: Wire :rerun to replay the most recent user message without creating a duplicate entry.
-            elif cmd == ":rerun":
-                self.cmd_rerun(ctx)
-            # orion: Use a shared helper for both kebab-case and camelCase clear commands.
-            elif cmd == ":clear-changes" or cmd == ":clearChanges":
-                self.cmd_clear_changes(ctx)
-            elif cmd == ":refresh":
-                self.cmd_refresh(ctx)
-            elif cmd == ":reset-state":
-                self.cmd_reset_state(ctx)
-            elif cmd == ":refresh-deps":
-                self.cmd_refresh_deps(ctx)
-            elif cmd == ":status":
-                self.cmd_status(ctx)
-            elif cmd == ":consolidate":
-                self.cmd_consolidate(ctx)
             # orion: Remove :tokenCount; keep :splitFile utility command wired into the REPL.
             elif cmd == ":splitFile":
                 if len(parts) < 2:
@@ -1214,7 +1390,7 @@ class Orion:
                 pass
 
         # orion: Replace inline JSON Schema with centralized Pydantic model schema.
-        response_schema = ConversationResponse.model_json_schema()
+        response_schema = _CONVERSATION_SCHEMA
 
         # Rebuild messages: prepend latest system_state, then conversation system prompt, then replay history excluding previous system_state echoes
         messages: List[Dict[str, Any]] = []
@@ -1231,15 +1407,10 @@ class Orion:
                         continue
                 except Exception:
                     pass
-            msg = h.copy()
-            if "ts" in msg:
-                del msg["ts"]
-            messages.append(msg)
+            messages.append(h)
 
         # orion: Build tools from reflective internal specs + explicit external PD specs.
-        tools = []
-        tools.extend(self.internal_tool_specs)
-        tools.extend(_external_tool_definitions())
+        tools = self.tool_specs
 
         def runner(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
             # orion: Generic runner that injects/strips reason_for_call and returns a wrapped result.
@@ -1260,6 +1431,10 @@ class Orion:
             self.storage.append_raw_message(msg)
             self.history.append(msg)
 
+        def sink_many(msgs: List[Dict[str, Any]]) -> None:
+            self.storage.append_raw_messages(msgs)
+            self.history.extend(msgs)
+
         ctx.log("Calling model for conversation response...")
         # orion: Pass the optional per-turn model override to Responses API; when None, the client's default model is used.
         final_json = self.client.call_responses(
@@ -1269,6 +1444,7 @@ class Orion:
             response_schema,
             interactive_tool_runner=runner,
             message_sink=sink,
+            message_batch_sink=sink_many,
             call_type="conversation",
             model=override_model,
         )
@@ -1325,66 +1501,13 @@ class Orion:
 
 # orion: Update docstring to reflect CLI-driven external directory configuration and revised help text.
 
+# orion: The CLI entrypoint lives in the dependency-free cli module so `orion --help` does not import the agent stack;
+# this wrapper keeps `python -m orion.workbench.main` and existing imports of main.main working.
 def main() -> None:
-    """
-    Orion CLI entrypoint.
-
-    Usage:
-        orion [--external-dir PATH|-e PATH] [repo_root]
-
-    Notes:
-        - OPENAI_API_KEY and AI_MODEL must be set in the environment.
-        - Optional: ORION_DEP_TTL_SEC influences dependency summary TTL behavior.
-        - If repo_root is not supplied, the current directory is used.
-
-    Options:
-        -e, --external-dir PATH   External Project Description directory (flat). When omitted, external dependency features are disabled.
-    """
-    args = sys.argv[1:]
-
-    # Help handling (recognized anywhere in argv)
-    if any(a in ("-h", "--help") for a in args):
-        print("Usage: orion [--external-dir PATH|-e PATH] [repo_root]")
-        print("Options:")
-        print("  -e, --external-dir PATH   External Project Description directory (flat). When omitted, external deps are disabled.")
-        print("Environment:")
-        print("  OPENAI_API_KEY, AI_MODEL, ORION_DEP_TTL_SEC")
-        return
-
-    # orion: Implement minimal flag parsing for --external-dir/-e (supports --external-dir=PATH and -e PATH). The first non-flag argument is treated as repo_root.
-    external_dir = None
-    repo_root_arg = None
-    i = 0
-    while i < len(args):
-        a = args[i]
-        if a == "-e":
-            if i + 1 >= len(args):
-                print("error: -e requires a PATH argument")
-                return
-            external_dir = args[i + 1]
-            i += 2
-            continue
-        if a == "--external-dir":
-            if i + 1 >= len(args):
-                print("error: --external-dir requires a PATH argument")
-                return
-            external_dir = args[i + 1]
-            i += 2
-            continue
-        if a.startswith("--external-dir="):
-            external_dir = a.split("=", 1)[1]
-            i += 1
-            continue
-        if a.startswith("-"):
-            print(f"error: unknown option: {a}")
-            return
-        # First non-flag is repo_root
-        if repo_root_arg is None:
-            repo_root_arg = a
-        i += 1
+    """Orion CLI entrypoint; see orion.workbench.cli.main."""
+    from .cli import main as _cli_main
 
-    repo_root = pathlib.Path(repo_root_arg).resolve() if repo_root_arg else pathlib.Path(".").resolve()
-    Orion(repo_root, external_dir=external_dir).run()
+    _cli_main()
 
 
 if __name__ == "__main__":
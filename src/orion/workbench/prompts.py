@@ -1,8 +1,15 @@
 # orion: Introduced a small helper to load prompt templates from orion.resources via importlib.resources and optionally format them with dynamic values. This centralizes prompt management and enables reuse across modules. Added docstring clarifying brace handling and formatting behavior.
 
+from functools import lru_cache
 from importlib import resources
 
 
+# orion: Packaged prompts are immutable for the life of the process; read each resource once.
+@lru_cache(maxsize=None)
+def _read_prompt(name: str) -> str:
+    return resources.files("orion.workbench.resources").joinpath(name).read_text(encoding="utf-8")
+
+
 def get_prompt(name: str, **kwargs) -> str:
     """
     Load a text prompt from the orion.resources package.
@@ -12,7 +19,7 @@ def get_prompt(name: str, **kwargs) -> str:
     raw text without attempting formatting to avoid accidental brace handling in
     prompts that show JSON examples.
     """
-    data = resources.files("orion.workbench.resources").joinpath(name).read_text(encoding="utf-8")
+    data = _read_prompt(name)
     if kwargs:
         return data.format(**kwargs)
     return data
@@ -20,6 +20,13 @@ from .prompts import get_prompt
 from .models import CustomBaseModel, CodeSummary, InfoSummary, HtmlSummary, CssSummary
 
 
+# orion: Summary schemas come from static models; derive them once instead of per summarized file.
+_CODE_SCHEMA: Dict[str, Any] = CodeSummary.model_json_schema()
+_INFO_SCHEMA: Dict[str, Any] = InfoSummary.model_json_schema()
+_HTML_SCHEMA: Dict[str, Any] = HtmlSummary.model_json_schema()
+_CSS_SCHEMA: Dict[str, Any] = CssSummary.model_json_schema()
+
+
 # orion: Add a small heuristic docstring for language detection.
 
 def guess_language(path: str) -> str:
@@ -132,7 +139,7 @@ def summarize_file(ctx: Context, client: ChatCompletionsClient, repo_root: pathl
     # orion: Image branch — build a base64 data URL and use a vision-capable model to return strict InfoSummary {"s": "..."}.
     if language_tag == "image":
         system_txt = get_prompt("prompt_summarizer_image_system.txt")
-        schema = InfoSummary.model_json_schema()
+        schema = _INFO_SCHEMA
         model_cls = InfoSummary
 
         mime = image_mime_for_extension(rel_path)
@@ -197,20 +204,20 @@ def summarize_file(ctx: Context, client: ChatCompletionsClient, repo_root: pathl
     # orion: Route by language to minimal summary schemas (CodeSummary/HtmlSummary/InfoSummary/CssSummary) and prompts; emit minimal objects only (no headers/meta).
     if language_tag == "html":
         system_txt = get_prompt("prompt_summarizer_html_system.txt")
-        schema = HtmlSummary.model_json_schema()
+        schema = _HTML_SCHEMA
         model_cls = HtmlSummary
     elif language_tag == "css":
         system_txt = get_prompt("prompt_summarizer_css_system.txt")
-        schema = CssSummary.model_json_schema()
+        schema = _CSS_SCHEMA
         model_cls = CssSummary
     elif language_tag == "info":
         system_txt = get_prompt("prompt_summarizer_info_system.txt")
-        schema = InfoSummary.model_json_schema()
+        schema = _INFO_SCHEMA
         model_cls = InfoSummary
     else:
         # Default: treat as code
         system_txt = get_prompt("prompt_summarizer_code_system.txt", line_cap=LINE_CAP)
-        schema = CodeSummary.model_json_schema()
+        schema = _CODE_SCHEMA
         model_cls = CodeSummary
 
     user_txt = json.dumps({"info": info, "content": text}, ensure_ascii=False)
@@ -270,6 +277,9 @@ class ProjectOrionSummary(CustomBaseModel):
 
 # orion: Document the PD summarization flow and migrate to the Responses API to unify endpoints with file summarizer.
 
+_POS_SCHEMA: Dict[str, Any] = ProjectOrionSummary.model_json_schema()
+
+
 def summarize_project_description(
     ctx: Context,
     client: ChatCompletionsClient,
@@ -303,7 +313,7 @@ def summarize_project_description(
     # orion: Load PD summarizer system prompt from resources.
     system_txt = get_prompt("prompt_summarizer_pd_system.txt")
     user_txt = json.dumps({"info": info, "content": text}, ensure_ascii=False)
-    schema = ProjectOrionSummary.model_json_schema()
+    schema = _POS_SCHEMA
 
     messages = [
         {"role": "system", "content": system_txt},
@@ -1,12 +1,18 @@
 # orion: Slim tool surface to core set and reflective registry. Remove get_file_snippet and get_summary; promote get_file_contents to be used with system_state promotions.
 
 import inspect
+import itertools
 import json
+import os
 import pathlib
-from typing import Any, Dict, List, Optional, Callable, get_type_hints
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Callable, Tuple, get_type_hints
 
 from .context import Context
-from .fs import list_repo_paths, normalize_path, read_file, count_lines, read_json, read_jsonl, write_file, now_ts
+from .fs import iter_repo_paths, repo_paths_snapshot, normalize_path, read_file, count_lines, read_json, read_jsonl, write_file, now_ts
+from .fs import _safe_abs, _ensure_not_ignored
 import yaml
 import requests
 import re
@@ -82,11 +88,38 @@ def tool(name: str, description: str, *, param_overrides: Optional[Dict[str, Dic
             "description": description,
             "schema": _build_parameters_schema(fn, overrides=param_overrides),
             "param_overrides": param_overrides or {},
+            # orion: Precompiled argument spec used by run_tool (see _compile_params).
+            "params": _compile_params(fn, param_overrides),
         }
         return fn
     return _wrap
 
 
+# orion: Resolve signature, type hints and any schema "pattern"/"enum" overrides once at registration instead of on every
+# dispatch. run_tool checks model-supplied arguments against this spec before invoking the tool: required parameters
+# must be present, int/float parameters must coerce to their type, and pattern/enum overrides must match. This is not
+# full JSON Schema validation; other schema keywords and non-scalar annotations are not checked.
+def _compile_params(
+    fn: Callable, overrides: Optional[Dict[str, Dict[str, Any]]] = None
+) -> List[Tuple[str, Any, bool, Optional["re.Pattern[str]"], Optional[Tuple[Any, ...]]]]:
+    """Return (name, annotation, required, compiled pattern or None, enum values or None) for each parameter after ctx."""
+    sig = inspect.signature(fn)
+    hints = get_type_hints(fn)
+    out: List[Tuple[str, Any, bool, Optional["re.Pattern[str]"], Optional[Tuple[Any, ...]]]] = []
+    for p in list(sig.parameters.values())[1:]:
+        ov = (overrides or {}).get(p.name) or {}
+        pattern = ov.get("pattern")
+        enum = ov.get("enum")
+        out.append((
+            p.name,
+            hints.get(p.name, str),
+            p.default is inspect._empty,
+            re.compile(pattern) if pattern else None,
+            tuple(enum) if enum else None,
+        ))
+    return out
+
+
 def discover_tools() -> List[Dict[str, Any]]:
     """Return OpenAI tool specs for all registered internal tools, with synthetic reason param."""
     specs: List[Dict[str, Any]] = []
@@ -133,16 +166,20 @@ def run_tool(ctx: Context, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
     if not meta:
         return {"reason_for_call": reason, "result": {"_meta_error": f"unknown tool {name}", "_args_echo": args}}
     fn: Callable = meta["fn"]
-    sig = inspect.signature(fn)
-    hints = get_type_hints(fn)
     kwargs: Dict[str, Any] = {}
-    # Skip first param (ctx)
-    for p in list(sig.parameters.values())[1:]:
-        nm = p.name
-        ann = hints.get(nm, str)
+    # Parameters after ctx, precompiled at registration (see _compile_params for what is checked)
+    for nm, ann, required, pattern, enum in meta["params"]:
         if nm in args:
-            kwargs[nm] = _coerce_value(args[nm], ann)
-        elif p.default is inspect._empty:
+            val = _coerce_value(args[nm], ann)
+            # _coerce_value hands back the raw value when int()/float() fail; reject it rather than pass it on.
+            if ann in (int, float) and type(val) is not ann:
+                return {"reason_for_call": reason, "result": {"_meta_error": f"invalid parameter {nm}: expected {_type_map[ann]['type']}", "_args_echo": args}}
+            if pattern is not None and isinstance(val, str) and not pattern.search(val):
+                return {"reason_for_call": reason, "result": {"_meta_error": f"invalid parameter {nm}: must match {pattern.pattern}", "_args_echo": args}}
+            if enum is not None and val not in enum:
+                return {"reason_for_call": reason, "result": {"_meta_error": f"invalid parameter {nm}: must be one of {list(enum)}", "_args_echo": args}}
+            kwargs[nm] = val
+        elif required:
             return {"reason_for_call": reason, "result": {"_meta_error": f"missing required parameter: {nm}"}}
     try:
         raw = fn(ctx, **kwargs)
@@ -159,14 +196,143 @@ def run_tool(ctx: Context, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
 # Internal tools (typed, raw returns)
 # -----------------------------
 
-# orion: list_paths returns a list of repo-relative paths, optionally filtered by glob.
-@tool(name="list_paths", description="List repository files; optionally filter by glob.")
+# orion: Bounded LRU of file data shared by get_file_contents and search_files, keyed by absolute path and validated
+# against (mtime_ns, size) on every hit. An entry holds the decoded text and/or the ASCII-folded raw bytes searched by
+# search_files; each form is filled in only when a caller asks for it. Tools may run on the client's worker threads,
+# so access is serialized by a lock.
+_FILE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_FILE_CACHE: "OrderedDict[str, Tuple[int, int, Optional[str], Optional[bytes]]]" = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+_file_cache_bytes = 0
+
+# orion: Lowercase A-Z only; folding bytes this way keeps UTF-8 sequences intact and needs no decode.
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+
+def _entry_bytes(entry: Tuple[int, int, Optional[str], Optional[bytes]]) -> int:
+    return entry[1] * ((entry[2] is not None) + (entry[3] is not None))
+
+
+def _cache_get(repo_root: pathlib.Path, path: str) -> Tuple[str, os.stat_result, Optional[Tuple[int, int, Optional[str], Optional[bytes]]]]:
+    """Resolve path, enforce ignore rules and return (key, stat, current cache entry or None)."""
+    abs_path = _safe_abs(repo_root, path)
+    # Ignore rules are checked on every call, hit or miss, so .orionignore edits take effect immediately.
+    _ensure_not_ignored(repo_root, abs_path)
+    key = str(abs_path)
+    st = os.stat(key)
+    with _FILE_CACHE_LOCK:
+        hit = _FILE_CACHE.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            _FILE_CACHE.move_to_end(key)
+            return key, st, hit
+    return key, st, None
+
+
+def _cache_put(key: str, st: os.stat_result, content: Optional[str], folded: Optional[bytes]) -> None:
+    global _file_cache_bytes
+    with _FILE_CACHE_LOCK:
+        old = _FILE_CACHE.pop(key, None)
+        if old is not None:
+            _file_cache_bytes -= _entry_bytes(old)
+            # Keep the other form if the file is unchanged.
+            if old[0] == st.st_mtime_ns and old[1] == st.st_size:
+                content = content if content is not None else old[2]
+                folded = folded if folded is not None else old[3]
+        entry = (st.st_mtime_ns, st.st_size, content, folded)
+        _FILE_CACHE[key] = entry
+        _file_cache_bytes += _entry_bytes(entry)
+        while _file_cache_bytes > _FILE_CACHE_MAX_BYTES and len(_FILE_CACHE) > 1:
+            _, ev = _FILE_CACHE.popitem(last=False)
+            _file_cache_bytes -= _entry_bytes(ev)
+
+
+def _cached_read(repo_root: pathlib.Path, path: str) -> str:
+    """Return a repo file's text, reusing an unchanged cached read."""
+    key, st, hit = _cache_get(repo_root, path)
+    if hit is not None and hit[2] is not None:
+        return hit[2]
+    content = read_file(repo_root, path)
+    _cache_put(key, st, content, None)
+    return content
+
+
+# orion: search_files looks at one filesystem block first: a NUL byte there marks a binary file, which is skipped
+# without reading the rest, and a hit there answers the query without reading the rest either. Only files that get
+# past the peek without a hit are read in full, and those are cached folded for later queries.
+_PEEK_BYTES = 4096
+_PEEK_LOCAL = threading.local()
+
+# orion: search_files worker count and how many files are handed to the pool at a time.
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+_SEARCH_CHUNK = 64
+
+
+def _file_contains(repo_root: pathlib.Path, path: str, q_bytes: bytes) -> bool:
+    """Return whether the repo file contains q_bytes, comparing ASCII letters case-insensitively."""
+    key, st, hit = _cache_get(repo_root, path)
+    if hit is not None and hit[3] is not None:
+        return hit[3].find(q_bytes) != -1
+    # orion: Peek into a per-thread scratch buffer through an unbuffered handle: no per-file read buffer or head
+    # bytes object is allocated, and only the folded copy needed for the comparison is created.
+    buf = getattr(_PEEK_LOCAL, "buf", None)
+    if buf is None:
+        buf = _PEEK_LOCAL.buf = bytearray(_PEEK_BYTES)
+    with open(key, "rb", buffering=0) as f:
+        n = f.readinto(buf) or 0
+        if buf.find(b"\0", 0, n) != -1:
+            return False
+        folded_head = buf.translate(_ASCII_LOWER)
+        if folded_head.find(q_bytes, 0, n) != -1:
+            return True
+        # A short read on a regular file means end of file.
+        rest = f.read() if n == _PEEK_BYTES else b""
+    head = bytes(folded_head[:n])
+    if not rest:
+        folded = head
+    else:
+        folded = head + rest.translate(_ASCII_LOWER)
+    _cache_put(key, st, None, folded)
+    return folded.find(q_bytes, max(0, len(head) - len(q_bytes) + 1)) != -1
+
+
+# orion: Most paths list_paths returns in one call.
+_LIST_PATHS_CAP = 2000
+_GLOB_CHARS = re.compile(r"[*?[]")
+# orion: (repo_root, glob) -> (listing snapshot the result was computed from, result paths); see list_paths.
+_LIST_PATHS_RESULTS: Dict[Tuple[pathlib.Path, str], Tuple[Tuple[str, ...], List[str]]] = {}
+_LIST_PATHS_RESULTS_MAX = 64
+
+
+# orion: list_paths returns a list of repo-relative paths, optionally filtered by a case-insensitive glob (the same
+# on every platform, unlike fnmatch.fnmatch, which folds case only on Windows).
+@tool(name="list_paths", description="List repository files; optionally filter by a case-insensitive glob.")
 def list_paths(ctx: Context, glob: Optional[str] = None) -> Dict[str, Any]:
-    paths = list_repo_paths(ctx.repo_root)
-    if glob:
+    # orion: Filter while iterating and stop at the cap, so neither the full listing nor the ignore checks for paths
+    # past the first 2000 matches are ever materialized. The glob is lowered and translated to a regex once.
+    # orion: Repeated identical calls against the same cached listing return the same capped list; results are keyed
+    # to the listing snapshot object, so a relisting or an invalidation after writes makes them stale automatically.
+    key = (ctx.repo_root, glob or "")
+    snap = repo_paths_snapshot(ctx.repo_root)
+    hit = _LIST_PATHS_RESULTS.get(key)
+    if snap is not None and hit is not None and hit[0] is snap:
+        return {"paths": hit[1]}
+    it: Iterator[str] = iter_repo_paths(ctx.repo_root)
+    if glob and not _GLOB_CHARS.search(glob):
+        # A pattern without metacharacters only ever matches itself.
+        q = glob.lower()
+        it = (p for p in it if p.lower() == q)
+    elif glob:
         import fnmatch
-        paths = [p for p in paths if fnmatch.fnmatch(p, glob)]
-    return {"paths": paths[:2000]}
+        pat = re.compile(fnmatch.translate(glob.lower()), re.IGNORECASE)
+        it = (p for p in it if pat.match(p))
+    paths = list(itertools.islice(it, _LIST_PATHS_CAP))
+    # The snapshot exists now if this call (or an earlier one) consumed a complete listing.
+    snap = repo_paths_snapshot(ctx.repo_root)
+    if snap is not None:
+        if len(_LIST_PATHS_RESULTS) >= _LIST_PATHS_RESULTS_MAX:
+            _LIST_PATHS_RESULTS.clear()
+        _LIST_PATHS_RESULTS[key] = (snap, paths)
+    return {"paths": paths}
 
 
 # orion: get_file_contents returns full file contents and a line_count, or _meta_error.
@@ -174,28 +340,57 @@ def list_paths(ctx: Context, glob: Optional[str] = None) -> Dict[str, Any]:
 def get_file_contents(ctx: Context, path: str) -> Dict[str, Any]:
     np = normalize_path(path)
     try:
-        content = read_file(ctx.repo_root, np)
+        content = _cached_read(ctx.repo_root, np)
     except Exception:
         return {"_meta_error": f"Could not read {np}"}
     return {"path": np, "content": content, "line_count": count_lines(content)}
 
 
 # orion: Rename tool from search_code to search_files to unify tool naming across code and docs; behavior unchanged.
-@tool(name="search_files", description="Search files for a substring; returns paths.")
+# orion: The description states the matching rules the model can observe: binary files are skipped, and ASCII queries
+# fold only A-Z (non-ASCII text is compared as-is) while non-ASCII queries use full Unicode lowercasing.
+@tool(
+    name="search_files",
+    description=(
+        "Search files for a substring; returns paths. Case-insensitive: for ASCII queries only A-Z are case-folded "
+        "(non-ASCII characters in files must match exactly); queries containing non-ASCII characters use full Unicode "
+        "lowercasing. Files with a NUL byte in their first 4 KB are treated as binary and skipped."
+    ),
+)
 def search_files(ctx: Context, query: str, max_results: int = 100) -> Dict[str, Any]:
     q = (query or "").lower()
     if not q:
         return {"matches": []}
     matches: List[Dict[str, Any]] = []
-    for p in list_repo_paths(ctx.repo_root):
+    # orion: Clamp the model-supplied cap up front (same ceiling as list_paths) rather than trusting it.
+    limit = max(1, min(int(max_results), _LIST_PATHS_CAP))
+    truncated = limit < int(max_results)
+    # orion: ASCII needles (the common case) are matched against ASCII-folded raw bytes, so no file is decoded or
+    # copied by str.lower(); files with a NUL byte in their first block are treated as binary and skipped (see
+    # _file_contains). Other needles use the Unicode-aware text path.
+    q_bytes = q.encode("utf-8").translate(_ASCII_LOWER) if q.isascii() else None
+
+    def _scan_one(p: str) -> bool:
         try:
-            content = read_file(ctx.repo_root, p)
+            if q_bytes is not None:
+                return _file_contains(ctx.repo_root, p, q_bytes)
+            return q in _cached_read(ctx.repo_root, p).lower()
         except Exception:
-            continue
-        if q in content.lower():
-            matches.append({"path": p})
-        if len(matches) >= int(max_results):
-            break
+            return False
+
+    # orion: Reads block outside the GIL, so files are scanned on a thread pool. Work is submitted a chunk at a time
+    # and results are taken in listing order, so the matches (and where max_results cuts them off) are the same as a
+    # sequential scan, and no chunk past the one that fills the limit is started.
+    # Paths are pulled from the lazy listing a chunk at a time, so stopping early also skips the .orionignore checks
+    # for the rest of the repository.
+    path_iter = iter_repo_paths(ctx.repo_root)
+    with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS, thread_name_prefix="orion-search") as pool:
+        while chunk := list(itertools.islice(path_iter, _SEARCH_CHUNK)):
+            for p, hit in zip(chunk, pool.map(_scan_one, chunk), strict=True):
+                if hit:
+                    matches.append({"path": p})
+                    if len(matches) >= limit:
+                        return {"matches": matches, "_meta_truncated": True} if truncated else {"matches": matches}
     return {"matches": matches}
 
 